@@ -21,12 +21,63 @@ from nblite import nbl_export, show_doc; nbl_export();
 
 # %%
 #|export
+import functools
 import json
+import sys
 import toml
+from array import array
 from pathlib import Path
-from collections import deque
+from collections import OrderedDict, deque
 
 _DEFAULT_CONFIG_PATH = Path("~/.config/boxyard/config.toml")
+_QUERY_CACHE_MAXSIZE = 1024  # Per instance; least recently used results are evicted first
+
+
+def _iter_bits(bits: int):
+    """Yield the indices of the set bits of `bits`, lowest first."""
+    while bits:
+        lsb = bits & -bits
+        yield lsb.bit_length() - 1
+        bits ^= lsb
+
+
+def _to_csr(n: int, edges: list[tuple[int, int]]) -> tuple[array, array]:
+    """Pack (source, target) edges over nodes 0..n-1 into compressed sparse row form.
+
+    The targets of node i are `targets[offsets[i]:offsets[i + 1]]`, in edge order.
+    """
+    offsets = array("i", [0]) * (n + 1)
+    for source, _ in edges:
+        offsets[source + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    targets = array("i", [0]) * len(edges)
+    next_slot = offsets[:-1]
+    for source, target in edges:
+        targets[next_slot[source]] = target
+        next_slot[source] += 1
+    return offsets, targets
+
+
+def _intern_groups(groups) -> frozenset[str] | None:
+    """Normalize a group filter to a frozenset of interned names, matching the interned metadata."""
+    return None if groups is None else frozenset(map(sys.intern, groups))
+
+
+def _memoized_query(method):
+    """Cache which boxes a read-only query returns, keyed by its arguments.
+
+    The wrapped method returns box indices; only those are cached, and every call
+    builds fresh result dicts so callers can't alter what later calls see.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, box_id: str, groups: set[str] | None = None) -> tuple[dict, ...]:
+        groups = _intern_groups(groups)
+        idxs = self._cached_query((method.__name__, box_id, groups), lambda: tuple(method(self, box_id, groups)))
+        return self._results_of(idxs)
+
+    return wrapper
 
 
 class BoxyardFast:
@@ -43,6 +94,9 @@ class BoxyardFast:
         self._boxes = box_metas
         self._by_id: dict[str, dict] = {}
         self._children_index: dict[str, list[str]] = {}
+        self._groups_of: dict[str, list[str]] = {}
+        # The instance is never mutated after construction, so cached results never go stale
+        self._query_cache: OrderedDict[tuple, tuple[int, ...] | dict] = OrderedDict()
 
         for bm in box_metas:
             ts = bm["creation_timestamp_utc"]
@@ -51,12 +105,109 @@ class BoxyardFast:
             bm["_box_id"] = box_id
             bm["_index_name"] = f"{box_id}__{bm['name']}"
             self._by_id[box_id] = bm
+            # These values repeat across most boxes; intern them so all boxes share one copy
+            for key in ("storage_location", "creator_hostname"):
+                if key in bm:
+                    bm[key] = sys.intern(bm[key])
+            if "groups" in bm:
+                bm["groups"] = [sys.intern(g) for g in bm["groups"]]
+            self._groups_of[box_id] = bm.get("groups", [])
 
         # Build children index from parents
         for bm in box_metas:
             for parent_id in bm.get("parents", []):
                 self._children_index.setdefault(parent_id, []).append(bm["_box_id"])
 
+        # Each box gets an index i; adjacency is kept as CSR index arrays over those indices
+        self._metas_by_idx: list[dict] = list(self._by_id.values())
+        self._idx: dict[str, int] = {box_id: i for i, box_id in enumerate(self._by_id)}
+        n = len(self._metas_by_idx)
+        edges = []  # (parent, child) index pairs between known boxes
+        for i, bm in enumerate(self._metas_by_idx):
+            for parent_id in bm.get("parents", []):
+                p = self._idx.get(parent_id)
+                if p is not None:
+                    edges.append((p, i))
+        self._child_offsets, self._child_idx = _to_csr(n, edges)
+        self._parent_offsets, self._parent_idx = _to_csr(n, [(c, p) for p, c in edges])
+
+    # The bitsets below are only built on first use: constructing an instance just to walk
+    # the DAG (e.g. get_dag_nested) never pays for the reachability closure
+
+    @functools.cached_property
+    def _topo_order(self) -> array:
+        """Box indices in parents-first order (Kahn's algorithm), missing any box on or below a cycle."""
+        n = len(self._metas_by_idx)
+        offsets = self._parent_offsets
+        indegree = array("i", (offsets[i + 1] - offsets[i] for i in range(n)))
+        queue = deque(i for i in range(n) if indegree[i] == 0)
+        order = array("i")
+        while queue:
+            i = queue.popleft()
+            order.append(i)
+            for c in self._children_idx_of(i):
+                indegree[c] -= 1
+                if indegree[c] == 0:
+                    queue.append(c)
+        return order
+
+    def _reach_by_dfs(self, i: int, neighbours, closed: bytearray, closure: list[int]) -> int:
+        # Bits of every box reachable from box i via `neighbours`; boxes marked in `closed`
+        # already have their full closure computed, so they aren't expanded further
+        reach = 0
+        stack = list(neighbours(i))
+        while stack:
+            c = stack.pop()
+            if (reach >> c) & 1:
+                continue
+            reach |= 1 << c
+            if closed[c]:
+                reach |= closure[c]
+            else:
+                stack.extend(neighbours(c))
+        return reach
+
+    @functools.cached_property
+    def _reach_bits(self) -> tuple[list[int], list[int]]:
+        """Per box: the bitset of its descendants and the bitset of its ancestors."""
+        n = len(self._metas_by_idx)
+        order = self._topo_order
+        in_order = bytearray(n)
+        for i in order:
+            in_order[i] = 1
+        desc_bits = [0] * n
+        anc_bits = [0] * n
+
+        # One topological order drives both closures: ancestors parents-first, descendants
+        # in reverse. Boxes on or below a cycle are missing from the order, and so are all
+        # of their descendants; those few are closed with a DFS instead.
+        no_closure = bytearray(n)
+        for i in range(n):
+            if not in_order[i]:
+                desc_bits[i] = self._reach_by_dfs(i, self._children_idx_of, no_closure, desc_bits)
+        for i in reversed(order):
+            bits = 0
+            for c in self._children_idx_of(i):
+                bits |= desc_bits[c] | (1 << c)
+            desc_bits[i] = bits
+        for i in order:
+            bits = 0
+            for p in self._parents_idx_of(i):
+                bits |= anc_bits[p] | (1 << p)
+            anc_bits[i] = bits
+        for i in range(n):
+            if not in_order[i]:
+                anc_bits[i] = self._reach_by_dfs(i, self._parents_idx_of, in_order, anc_bits)
+        return desc_bits, anc_bits
+
+    @functools.cached_property
+    def _group_bits(self) -> dict[str, int]:
+        group_bits: dict[str, int] = {}
+        for i, bm in enumerate(self._metas_by_idx):
+            for g in bm.get("groups", []):
+                group_bits[g] = group_bits.get(g, 0) | (1 << i)
+        return group_bits
+
     @classmethod
     def from_file(cls, path: str | Path | None = None, config_path: str | Path | None = None) -> "BoxyardFast":
         """Load from boxyard_meta.json, optionally reading config for user_boxes_path.
@@ -76,115 +227,201 @@ class BoxyardFast:
             path = Path(data_path).expanduser() / "boxyard_meta.json"
         path = Path(path)
 
-        data = json.loads(path.read_text())
+        # Bytes in one read: no text-mode wrapper or newline translation; json.loads decodes itself
+        data = json.loads(path.read_bytes())
         user_boxes_path = config.get("user_boxes_path")
         return cls(data, user_boxes_path=user_boxes_path)
 
     # ── helpers ──
 
-    def _filter_by_groups(self, boxes: list[dict], groups: set[str] | None) -> list[dict]:
+    def _cached_query(self, cache_key: tuple, compute):
+        """Return the cached result for `cache_key`, computing it with `compute()` on a miss."""
+        cache = self._query_cache
+        if cache_key in cache:
+            cache.move_to_end(cache_key)
+            return cache[cache_key]
+        result = cache[cache_key] = compute()
+        if len(cache) > _QUERY_CACHE_MAXSIZE:
+            cache.popitem(last=False)
+        return result
+
+    def _filter_by_groups(self, boxes: tuple[dict, ...], groups: set[str] | None) -> tuple[dict, ...]:
         if groups is None:
             return boxes
-        return [b for b in boxes if set(b.get("groups", [])) & groups]
+        return tuple(b for b in boxes if set(b.get("groups", [])) & groups)
+
+    def _children_idx_of(self, i: int) -> array:
+        return self._child_idx[self._child_offsets[i]:self._child_offsets[i + 1]]
+
+    def _parents_idx_of(self, i: int) -> array:
+        return self._parent_idx[self._parent_offsets[i]:self._parent_offsets[i + 1]]
+
+    def _children_idx_of_id(self, box_id: str):
+        i = self._idx.get(box_id)
+        if i is not None:
+            return self._children_idx_of(i)
+        # Not a known box, but boxes may still list it as a parent
+        return [self._idx[child_id] for child_id in self._children_index.get(box_id, [])]
+
+    def _bfs_idx(self, start, neighbours):
+        """Yield box indices breadth-first (nearest first) from the `start` indices, each once."""
+        seen = bytearray(len(self._metas_by_idx))
+        queue = deque()
+        for i in start:
+            if not seen[i]:
+                seen[i] = 1
+                queue.append(i)
+        while queue:
+            i = queue.popleft()
+            yield i
+            for j in neighbours(i):
+                if not seen[j]:
+                    seen[j] = 1
+                    queue.append(j)
+
+    def _desc_idx_of(self, box_id: str):
+        return self._bfs_idx(self._children_idx_of_id(box_id), self._children_idx_of)
+
+    def _anc_idx_of(self, box_id: str):
+        i = self._idx.get(box_id)
+        if i is None:
+            return iter(())
+        return self._bfs_idx(self._parents_idx_of(i), self._parents_idx_of)
+
+    def _desc_bits_of(self, box_id: str) -> int:
+        desc_bits = self._reach_bits[0]
+        i = self._idx.get(box_id)
+        if i is not None:
+            return desc_bits[i]
+        bits = 0
+        for c in self._children_idx_of_id(box_id):
+            bits |= desc_bits[c] | (1 << c)
+        return bits
+
+    def _group_mask(self, groups: set[str]) -> int:
+        # Group filtering is a single AND against the union of the groups' bitsets
+        mask = 0
+        for g in groups:
+            mask |= self._group_bits.get(g, 0)
+        return mask
+
+    def _idx_of_bits(self, bits: int, groups: set[str] | None) -> tuple[int, ...]:
+        if groups is not None:
+            bits &= self._group_mask(groups)
+        return tuple(_iter_bits(bits))
+
+    def _filter_idx(self, idxs, groups: set[str] | None):
+        if groups is None:
+            return idxs
+        mask = self._group_mask(groups)
+        return [i for i in idxs if (mask >> i) & 1]
+
+    def _results_of(self, idxs) -> tuple[dict, ...]:
+        return tuple(self._to_result(self._metas_by_idx[i]) for i in idxs)
 
     def _to_result(self, bm: dict) -> dict:
+        # Lists are copied too, so a caller editing a result can't reach the metadata
         return {
             "name": bm["name"],
             "box_id": bm["_box_id"],
             "index_name": bm["_index_name"],
-            "groups": bm.get("groups", []),
-            "parents": bm.get("parents", []),
+            "groups": list(bm.get("groups", [])),
+            "parents": list(bm.get("parents", [])),
             "storage_location": bm.get("storage_location", ""),
         }
 
     # ── parent-child queries ──
 
-    def children_of(self, box_id: str, groups: set[str] | None = None) -> list[dict]:
-        child_ids = self._children_index.get(box_id, [])
-        children = [self._by_id[cid] for cid in child_ids if cid in self._by_id]
-        return [self._to_result(c) for c in self._filter_by_groups(children, groups)]
+    @_memoized_query
+    def children_of(self, box_id: str, groups: set[str] | None = None) -> tuple[dict, ...]:
+        return self._filter_idx(self._children_idx_of_id(box_id), groups)
 
-    def descendants_of(self, box_id: str, groups: set[str] | None = None) -> list[dict]:
-        visited: set[str] = set()
-        queue = deque([box_id])
-        result = []
-        while queue:
-            current = queue.popleft()
-            for child_id in self._children_index.get(current, []):
-                if child_id not in visited and child_id in self._by_id:
-                    visited.add(child_id)
-                    result.append(self._by_id[child_id])
-                    queue.append(child_id)
-        return [self._to_result(r) for r in self._filter_by_groups(result, groups)]
-
-    def parents_of(self, box_id: str, groups: set[str] | None = None) -> list[dict]:
+    @_memoized_query
+    def descendants_of(self, box_id: str, groups: set[str] | None = None) -> tuple[dict, ...]:
+        return self._filter_idx(self._desc_idx_of(box_id), groups)
+
+    def iter_descendants_of(self, box_id: str, groups: set[str] | None = None):
+        """Yield the descendants of `box_id` nearest first, walking the DAG lazily without caching."""
+        mask = None if groups is None else self._group_mask(_intern_groups(groups))
+        for i in self._desc_idx_of(box_id):
+            if mask is None or (mask >> i) & 1:
+                yield self._to_result(self._metas_by_idx[i])
+
+    def parents_of(self, box_id: str, groups: set[str] | None = None) -> tuple[dict, ...]:
         bm = self._by_id.get(box_id)
         if bm is None:
-            return []
-        parent_boxes = [self._by_id[pid] for pid in bm.get("parents", []) if pid in self._by_id]
-        return [self._to_result(p) for p in self._filter_by_groups(parent_boxes, groups)]
-
-    def ancestors_of(self, box_id: str, groups: set[str] | None = None) -> list[dict]:
-        visited: set[str] = set()
-        queue = deque([box_id])
-        result = []
-        while queue:
-            current = queue.popleft()
-            bm = self._by_id.get(current)
-            if bm is None:
-                continue
-            for parent_id in bm.get("parents", []):
-                if parent_id not in visited and parent_id in self._by_id:
-                    visited.add(parent_id)
-                    result.append(self._by_id[parent_id])
-                    queue.append(parent_id)
-        return [self._to_result(r) for r in self._filter_by_groups(result, groups)]
-
-    def roots(self, groups: set[str] | None = None) -> list[dict]:
-        root_boxes = [bm for bm in self._boxes if len(bm.get("parents", [])) == 0]
-        return [self._to_result(r) for r in self._filter_by_groups(root_boxes, groups)]
-
-    def leaves(self, groups: set[str] | None = None) -> list[dict]:
-        all_parent_ids: set[str] = set()
-        for bm in self._boxes:
-            all_parent_ids.update(bm.get("parents", []))
-        leaf_boxes = [bm for bm in self._boxes if bm["_box_id"] not in all_parent_ids]
-        return [self._to_result(r) for r in self._filter_by_groups(leaf_boxes, groups)]
+            return ()
+        parent_boxes = tuple(self._by_id[pid] for pid in bm.get("parents", []) if pid in self._by_id)
+        return tuple(self._to_result(p) for p in self._filter_by_groups(parent_boxes, _intern_groups(groups)))
+
+    @_memoized_query
+    def ancestors_of(self, box_id: str, groups: set[str] | None = None) -> tuple[dict, ...]:
+        return self._filter_idx(self._anc_idx_of(box_id), groups)
+
+    @functools.cached_property
+    def _root_bits(self) -> int:
+        bits = 0
+        for i, bm in enumerate(self._metas_by_idx):
+            if not bm.get("parents"):
+                bits |= 1 << i
+        return bits
+
+    @functools.cached_property
+    def _leaf_bits(self) -> int:
+        # Any box listed as a parent has a child edge, so leaves are the boxes without children
+        offsets = self._child_offsets
+        bits = 0
+        for i in range(len(self._metas_by_idx)):
+            if offsets[i] == offsets[i + 1]:
+                bits |= 1 << i
+        return bits
+
+    def roots(self, groups: set[str] | None = None) -> tuple[dict, ...]:
+        groups = _intern_groups(groups)
+        return self._results_of(
+            self._cached_query(("roots", None, groups), lambda: self._idx_of_bits(self._root_bits, groups))
+        )
+
+    def leaves(self, groups: set[str] | None = None) -> tuple[dict, ...]:
+        groups = _intern_groups(groups)
+        return self._results_of(
+            self._cached_query(("leaves", None, groups), lambda: self._idx_of_bits(self._leaf_bits, groups))
+        )
 
     def is_ancestor(self, box_id: str, potential_ancestor_id: str) -> bool:
-        ancestors = self.ancestors_of(box_id)
-        return any(a["box_id"] == potential_ancestor_id for a in ancestors)
+        i = self._idx.get(box_id)
+        j = self._idx.get(potential_ancestor_id)
+        if i is None or j is None:
+            return False
+        return bool((self._reach_bits[1][i] >> j) & 1)
 
     def is_descendant(self, box_id: str, potential_descendant_id: str) -> bool:
-        descendants = self.descendants_of(box_id)
-        return any(d["box_id"] == potential_descendant_id for d in descendants)
+        j = self._idx.get(potential_descendant_id)
+        if j is None:
+            return False
+        return bool((self._desc_bits_of(box_id) >> j) & 1)
 
     def has_cycle(self) -> bool:
-        # Kahn's algorithm for topological sort — cycle exists if not all nodes processed
-        in_degree: dict[str, int] = {bid: 0 for bid in self._by_id}
-        for bm in self._boxes:
-            for parent_id in bm.get("parents", []):
-                if parent_id in in_degree:
-                    in_degree[bm["_box_id"]] = in_degree.get(bm["_box_id"], 0) + 1
-
-        # Recalculate properly: in_degree counts how many parents each node has (within known set)
-        in_degree = {bid: 0 for bid in self._by_id}
-        for bm in self._boxes:
-            for parent_id in bm.get("parents", []):
-                if parent_id in self._by_id:
-                    in_degree[bm["_box_id"]] += 1
-
-        queue = deque([bid for bid, deg in in_degree.items() if deg == 0])
-        processed = 0
-        while queue:
-            node = queue.popleft()
-            processed += 1
-            for child_id in self._children_index.get(node, []):
-                if child_id in in_degree:
-                    in_degree[child_id] -= 1
-                    if in_degree[child_id] == 0:
-                        queue.append(child_id)
-        return processed != len(self._by_id)
+        # Iterative DFS with tri-colour marking: a child that is still on the stack closes a cycle
+        white, grey, black = 0, 1, 2
+        colour = bytearray(len(self._metas_by_idx))
+        for start in range(len(self._metas_by_idx)):
+            if colour[start] != white:
+                continue
+            colour[start] = grey
+            stack = [(start, iter(self._children_idx_of(start)))]
+            while stack:
+                i, children = stack[-1]
+                c = next(children, None)
+                if c is None:
+                    colour[i] = black
+                    stack.pop()
+                elif colour[c] == grey:
+                    return True
+                elif colour[c] == white:
+                    colour[c] = grey
+                    stack.append((c, iter(self._children_idx_of(c))))
+        return False
 
     def would_create_cycle(self, child_id: str, proposed_parent_id: str) -> bool:
         if child_id == proposed_parent_id:
@@ -193,7 +430,9 @@ class BoxyardFast:
 
     # ── DAG representation ──
 
-    def get_dag(self) -> dict:
+    @functools.cached_property
+    def _dag(self) -> dict[str, dict]:
+        # Tuples, so nothing in the cache is shared with the metadata or the indexes
         result = {}
         for bm in self._boxes:
             box_id = bm["_box_id"]
@@ -201,65 +440,109 @@ class BoxyardFast:
                 "name": bm["name"],
                 "index_name": bm["_index_name"],
                 "box_id": box_id,
-                "groups": bm.get("groups", []),
-                "parents": bm.get("parents", []),
-                "children": self._children_index.get(box_id, []),
+                "groups": tuple(bm.get("groups", [])),
+                "parents": tuple(bm.get("parents", [])),
+                "children": tuple(self._children_index.get(box_id, [])),
             }
         return result
 
-    def get_dag_nested(self, root_id: str | None = None) -> dict:
-        def _build_subtree(box_id: str, visited: set[str]) -> dict | None:
-            if box_id in visited or box_id not in self._by_id:
-                return None
-            visited.add(box_id)
-            bm = self._by_id[box_id]
-            children = {}
-            for child_id in self._children_index.get(box_id, []):
-                child_tree = _build_subtree(child_id, visited)
-                if child_tree is not None:
-                    children[child_id] = child_tree
-            return {
-                "name": bm["name"],
-                "index_name": bm["_index_name"],
-                "box_id": box_id,
-                "groups": bm.get("groups", []),
-                "children": children,
+    def get_dag(self) -> dict[str, dict]:
+        # Built fresh from the cached entries, so callers can't alter what later calls see
+        return {
+            box_id: {
+                **node,
+                "groups": list(node["groups"]),
+                "parents": list(node["parents"]),
+                "children": list(node["children"]),
             }
+            for box_id, node in self._dag.items()
+        }
 
-        if root_id is not None:
-            visited: set[str] = set()
-            tree = _build_subtree(root_id, visited)
-            return {root_id: tree} if tree else {}
+    def _nested_node(self, i: int) -> dict:
+        bm = self._metas_by_idx[i]
+        return {
+            "name": bm["name"],
+            "index_name": bm["_index_name"],
+            "box_id": bm["_box_id"],
+            "groups": list(bm.get("groups", [])),
+            "children": {},
+        }
 
-        # Build from all roots
-        visited: set[str] = set()
+    def get_dag_nested(self, root_id: str | None = None) -> dict:
+        # Only the traversal is cached; the nested dicts are built fresh for every call
+        plan = self._cached_query(("get_dag_nested", root_id, None), lambda: self._dag_nested_plan(root_id))
         result = {}
+        nodes = []
+        for i, parent_pos in plan:
+            node = self._nested_node(i)
+            siblings = result if parent_pos < 0 else nodes[parent_pos]["children"]
+            siblings[node["box_id"]] = node
+            nodes.append(node)
+        return result
+
+    def _dag_nested_plan(self, root_id: str | None) -> tuple[tuple[int, int], ...]:
+        """Pre-order (box index, position of its parent in the plan or -1) pairs for get_dag_nested."""
+        # Shared across roots, so each box appears in the output only once
+        visited = bytearray(len(self._metas_by_idx))
+        plan = []
+
+        def _walk_subtree(root: int):
+            # Iterative pre-order DFS: an explicit stack of (plan position, child iterator)
+            # instead of one Python call frame per level
+            visited[root] = 1
+            plan.append((root, -1))
+            stack = [(len(plan) - 1, iter(self._children_idx_of(root)))]
+            while stack:
+                pos, child_iter = stack[-1]
+                c = next(child_iter, None)
+                if c is None:
+                    stack.pop()
+                elif not visited[c]:
+                    visited[c] = 1
+                    plan.append((c, pos))
+                    stack.append((len(plan) - 1, iter(self._children_idx_of(c))))
+
+        if root_id is not None:
+            i = self._idx.get(root_id)
+            if i is not None:
+                _walk_subtree(i)
+            return tuple(plan)
+
+        # Walk from all roots
         for bm in self._boxes:
             if len(bm.get("parents", [])) == 0:
-                tree = _build_subtree(bm["_box_id"], visited)
-                if tree is not None:
-                    result[bm["_box_id"]] = tree
-        return result
+                i = self._idx[bm["_box_id"]]
+                if not visited[i]:
+                    _walk_subtree(i)
+        return tuple(plan)
 
     # ── group queries ──
 
     def groups_of(self, box_id: str) -> list[str]:
-        bm = self._by_id.get(box_id)
-        if bm is None:
-            return []
-        return list(bm.get("groups", []))
+        return list(self._groups_of.get(box_id, []))
 
-    def boxes_by_group(self, group_name: str) -> list[dict]:
-        return [self._to_result(bm) for bm in self._boxes if group_name in bm.get("groups", [])]
+    def boxes_by_group(self, group_name: str) -> tuple[dict, ...]:
+        return self._results_of(self._cached_query(
+            ("boxes_by_group", group_name, None),
+            lambda: self._idx_of_bits(self._group_bits.get(group_name, 0), None),
+        ))
 
-    def all_boxes_with_groups(self) -> dict[str, list[str]]:
+    @functools.cached_property
+    def _all_boxes_with_groups(self) -> dict[str, list[str]]:
         return {bm["_index_name"]: list(bm.get("groups", [])) for bm in self._boxes}
 
-    def all_groups(self) -> list[str]:
+    @functools.cached_property
+    def _all_groups(self) -> tuple[str, ...]:
         groups: set[str] = set()
         for bm in self._boxes:
             groups.update(bm.get("groups", []))
-        return sorted(groups)
+        return tuple(sorted(groups))
+
+    def all_boxes_with_groups(self) -> dict[str, list[str]]:
+        return dict(self._all_boxes_with_groups)
+
+    def all_groups(self) -> list[str]:
+        return list(self._all_groups)
 
     # ── path-based queries ──
 
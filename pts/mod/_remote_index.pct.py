@@ -23,7 +23,12 @@ from nblite import nbl_export, show_doc; nbl_export();
 # %%
 #|export
 from pathlib import Path
+import atexit
+from collections.abc import Iterable
 import json
+import os
+import threading
+import time
 
 import boxyard.config
 from boxyard import const
@@ -31,28 +36,214 @@ from boxyard import const
 # %% [markdown]
 # # Cache Utilities
 
+# %% [markdown]
+# On disk, each storage location has a JSON snapshot (`<storage_location>.json`) plus an
+# append-only JSONL log of changes made since it was written (`<storage_location>.log`),
+# one `{"op": "set", "k": ..., "v": ...}` or `{"op": "del", "k": ...}` per line.
+# Loading replays the log over the snapshot (last write wins). `save_remote_index_cache`
+# writes a fresh snapshot and drops the log, and appending compacts the same way once
+# the log holds more than `REMOTE_INDEX_LOG_COMPACTION_FACTOR` ops per cached entry.
+#
+# Single-entry updates (`update_remote_index_cache`, `remove_from_remote_index_cache`)
+# are also batched in memory: the cache is marked dirty and its pending ops are only
+# appended to the log once it has been dirty for `REMOTE_INDEX_CACHE_FLUSH_INTERVAL`
+# seconds, when `flush_remote_index_cache` is called, or when the process exits. A
+# background timer enforces the interval even if no further updates arrive, so
+# long-lived processes such as the TUI don't hold changes in memory until they exit.
+# This turns N updates during a bulk sync into a single small append. Losing unflushed
+# entries (e.g. on a crash) is harmless, as `find_remote_box_by_id` falls back to a
+# remote scan.
+
+# %%
+#|export
+REMOTE_INDEX_CACHE_FLUSH_INTERVAL = 5.0  # seconds
+REMOTE_INDEX_LOG_COMPACTION_FACTOR = 2
+
+# %%
+#|exporti
+_dirty_caches: dict[Path, dict[str, str]] = {}  # cache path -> unflushed cache
+_dirty_ops: dict[Path, list[dict]] = {}  # cache path -> ops not yet appended to the log
+_dirty_since: dict[Path, float] = {}  # cache path -> time.monotonic() when it became dirty
+_log_op_counts: dict[Path, int] = {}  # cache path -> number of ops in the log on disk
+_remote_index_memo: dict[Path, tuple[tuple, dict[str, str]]] = {}  # cache path -> (file versions, parsed cache)
+_flush_timer: threading.Timer | None = None  # pending background flush, if any
+_lock = threading.RLock()  # guards the state above, which the flush timer shares
+
+
+def _reset_remote_index_state() -> None:
+    """Forget all batched changes and memos without writing anything, e.g. between tests."""
+    with _lock:
+        _cancel_flush_timer()
+        for state in (_dirty_caches, _dirty_ops, _dirty_since, _log_op_counts, _remote_index_memo):
+            state.clear()
+
 # %%
 #|export
 def get_remote_index_cache_path(config: boxyard.config.Config, storage_location: str) -> Path:
     """Get the path to the remote index cache file for a storage location."""
     return config.remote_indexes_path / f"{storage_location}.json"
 
+# %%
+#|exporti
+def _get_remote_index_log_path(cache_path: Path) -> Path:
+    return cache_path.with_suffix(".log")
+
 # %%
 #|export
 def load_remote_index_cache(config: boxyard.config.Config, storage_location: str) -> dict[str, str]:
     """
-    Load the remote index cache for a storage location.
+    Load the remote index cache for a storage location, including any
+    batched changes that have not been flushed to disk yet.
 
     Returns:
         Dict mapping box_id -> remote index_name
     """
     cache_path = get_remote_index_cache_path(config, storage_location)
-    if cache_path.exists():
+    with _lock:
+        if cache_path in _dirty_caches:
+            return dict(_dirty_caches[cache_path])
+        return _read_remote_index_cache(cache_path)
+
+# %%
+#|export
+def load_all_remote_index_caches(config: boxyard.config.Config) -> dict[str, dict[str, str]]:
+    """
+    Load the remote index caches of every storage location that has one,
+    discovering them with a single directory scan.
+
+    Returns:
+        Dict mapping storage location name -> (box_id -> remote index_name)
+    """
+    storage_locations = set()
+    try:
+        with os.scandir(config.remote_indexes_path) as it:
+            for entry in it:
+                storage_location, ext = os.path.splitext(entry.name)
+                if ext in (".json", ".log") and entry.is_file():
+                    storage_locations.add(storage_location)
+    except FileNotFoundError:
+        pass
+    # Caches with batched changes may not have reached the disk yet
+    with _lock:
+        storage_locations.update(p.stem for p in _dirty_caches if p.parent == config.remote_indexes_path)
+    return {sl: load_remote_index_cache(config, sl) for sl in sorted(storage_locations)}
+
+# %%
+#|exporti
+def _stat_version(path: Path) -> tuple[int, int, int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    # Snapshots are replaced by renaming a temp file over them, which always changes the
+    # inode, even when the new content has the same size within the same mtime tick
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino, stat.st_dev)
+
+
+def _apply_log_op(cache: dict[str, str], op: dict) -> None:
+    if op["op"] == "set":
+        cache[op["k"]] = op["v"]
+    else:
+        cache.pop(op["k"], None)
+
+
+def _read_remote_index_cache(cache_path: Path) -> dict[str, str]:
+    # Re-parse only if the snapshot or log changed since they were last read or written by this process
+    log_path = _get_remote_index_log_path(cache_path)
+    file_versions = (_stat_version(cache_path), _stat_version(log_path))
+    if file_versions == (None, None):
+        _remote_index_memo.pop(cache_path, None)
+        _log_op_counts.pop(cache_path, None)
+        return {}
+    memo = _remote_index_memo.get(cache_path)
+    if memo is not None and memo[0] == file_versions:
+        return dict(memo[1])
+
+    cache = {}
+    if file_versions[0] is not None:
+        try:
+            data = cache_path.read_bytes().strip()
+            # Cheap shape check: anything that isn't a JSON object is rejected without parsing
+            if data[:1] == b"{" and data[-1:] == b"}":
+                cache = json.loads(data)
+        except (ValueError, OSError):  # Includes JSONDecodeError and undecodable bytes
+            cache = {}
+    op_count = 0
+    if file_versions[1] is not None:
         try:
-            return json.loads(cache_path.read_text())
-        except (json.JSONDecodeError, IOError):
-            return {}
-    return {}
+            log_lines = log_path.read_bytes().splitlines()
+        except OSError:
+            log_lines = []
+        for line in log_lines:
+            try:
+                _apply_log_op(cache, json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                continue  # Skip torn or malformed lines, e.g. from an interrupted append
+            op_count += 1
+    _log_op_counts[cache_path] = op_count
+    _remote_index_memo[cache_path] = (file_versions, cache)
+    return dict(cache)
+
+# %%
+#|exporti
+def _write_remote_index_cache(cache_path: Path, cache: dict[str, str]) -> None:
+    # Compact output keeps `json` on its C encoder (`indent` forces the pure-Python one)
+    data = json.dumps(cache, separators=(",", ":")).encode()
+    # The snapshot supersedes the log. Drop the log first, so a crash in between can
+    # at worst lose recent entries, never replay stale ops over a newer snapshot
+    log_path = _get_remote_index_log_path(cache_path)
+    log_path.unlink(missing_ok=True)
+    # Atomic write: temp file + rename, so a crash can never leave a torn cache file
+    tmp_path = cache_path.with_suffix(".json.tmp")
+    try:
+        tmp_path.write_bytes(data)
+    except FileNotFoundError:
+        # Only the first write needs to create the directory
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(data)
+    tmp_path.replace(cache_path)
+    _log_op_counts[cache_path] = 0
+    _remote_index_memo[cache_path] = ((_stat_version(cache_path), None), dict(cache))
+
+# %%
+#|exporti
+def _append_remote_index_ops(cache_path: Path, cache: dict[str, str], ops: list[dict]) -> None:
+    op_count = _log_op_counts.get(cache_path, 0) + len(ops)
+    if op_count > REMOTE_INDEX_LOG_COMPACTION_FACTOR * len(cache):
+        # `cache` was loaded before other processes may have appended to the log, so
+        # compact what is on disk now, plus only this process's pending ops
+        _remote_index_memo.pop(cache_path, None)
+        cache = _read_remote_index_cache(cache_path)
+        for op in ops:
+            _apply_log_op(cache, op)
+        _write_remote_index_cache(cache_path, cache)
+        return
+    data = b"".join(json.dumps(op, separators=(",", ":")).encode() + b"\n" for op in ops)
+    log_path = _get_remote_index_log_path(cache_path)
+    # A single O_APPEND write, so concurrent appenders never interleave within a line
+    try:
+        with open(log_path, "ab") as f:
+            f.write(data)
+    except FileNotFoundError:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_path, "ab") as f:
+            f.write(data)
+    _log_op_counts[cache_path] = op_count
+    # Other processes may have appended too, so re-read the log on the next load
+    _remote_index_memo.pop(cache_path, None)
+
+# %%
+#|exporti
+def _discard_dirty(cache_path: Path) -> None:
+    _dirty_since.pop(cache_path, None)
+    _dirty_caches.pop(cache_path)
+    _dirty_ops.pop(cache_path)
+
+
+def _flush_dirty(cache_path: Path) -> None:
+    # Pending ops are only dropped once they're on disk, so a failed write is retried later
+    _append_remote_index_ops(cache_path, _dirty_caches[cache_path], _dirty_ops[cache_path])
+    _discard_dirty(cache_path)
 
 # %%
 #|export
@@ -62,7 +253,8 @@ def save_remote_index_cache(
     cache: dict[str, str],
 ) -> None:
     """
-    Save the remote index cache for a storage location.
+    Save the remote index cache for a storage location, replacing the
+    snapshot and compacting away its change log.
 
     Args:
         config: Boxyard config
@@ -70,8 +262,102 @@ def save_remote_index_cache(
         cache: Dict mapping box_id -> remote index_name
     """
     cache_path = get_remote_index_cache_path(config, storage_location)
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
-    cache_path.write_text(json.dumps(cache, indent=2))
+    with _lock:
+        _write_remote_index_cache(cache_path, cache)
+        # The cache is now on disk, so any pending batched changes are superseded
+        if cache_path in _dirty_caches:
+            _discard_dirty(cache_path)
+
+# %%
+#|exporti
+def _cancel_flush_timer() -> None:
+    global _flush_timer
+    if _flush_timer is not None:
+        _flush_timer.cancel()
+        _flush_timer = None
+
+
+def _schedule_flush_timer() -> None:
+    global _flush_timer
+    if _flush_timer is None:
+        # Daemon, so a pending flush never keeps the process alive; atexit covers exit
+        _flush_timer = threading.Timer(REMOTE_INDEX_CACHE_FLUSH_INTERVAL, _flush_from_timer)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+def _flush_from_timer() -> None:
+    try:
+        flush_remote_index_cache()
+    finally:
+        with _lock:
+            if _dirty_caches:
+                _schedule_flush_timer()  # Retry whatever failed to write
+
+# %%
+#|export
+def flush_remote_index_cache() -> None:
+    """Write all batched remote index cache changes to disk."""
+    with _lock:
+        _cancel_flush_timer()
+        for cache_path in list(_dirty_caches):
+            _flush_dirty(cache_path)
+
+
+atexit.register(flush_remote_index_cache)
+
+# %%
+#|exporti
+def _get_cache_for_update(config: boxyard.config.Config, storage_location: str) -> tuple[Path, dict[str, str]]:
+    cache_path = get_remote_index_cache_path(config, storage_location)
+    cache = _dirty_caches.get(cache_path)
+    if cache is None:
+        cache = _read_remote_index_cache(cache_path)
+    return cache_path, cache
+
+# %%
+#|exporti
+def _mark_dirty(cache_path: Path, cache: dict[str, str], ops: list[dict]) -> None:
+    _dirty_caches[cache_path] = cache
+    _dirty_ops.setdefault(cache_path, []).extend(ops)
+    now = time.monotonic()
+    dirty_since = _dirty_since.setdefault(cache_path, now)
+    if now - dirty_since >= REMOTE_INDEX_CACHE_FLUSH_INTERVAL:
+        _flush_dirty(cache_path)
+    else:
+        _schedule_flush_timer()
+
+# %%
+#|export
+def apply_remote_index_cache_ops(
+    config: boxyard.config.Config,
+    storage_location: str,
+    ops: Iterable[tuple[str, str | None]],
+) -> None:
+    """
+    Apply several changes to the remote index cache in one go: the cache is
+    loaded once and all changes are written out together.
+
+    The changes are batched in memory; see `flush_remote_index_cache`.
+
+    Args:
+        config: Boxyard config
+        storage_location: Name of the storage location
+        ops: (box_id, index_name) pairs, applied in order. An index_name of
+            None removes the entry.
+    """
+    with _lock:
+        cache_path, cache = _get_cache_for_update(config, storage_location)
+        log_ops = []
+        for box_id, index_name in ops:
+            if index_name is not None:
+                cache[box_id] = index_name
+                log_ops.append({"op": "set", "k": box_id, "v": index_name})
+            elif box_id in cache:
+                del cache[box_id]
+                log_ops.append({"op": "del", "k": box_id})
+        if log_ops:
+            _mark_dirty(cache_path, cache, log_ops)
 
 # %%
 #|export
@@ -84,15 +370,15 @@ def update_remote_index_cache(
     """
     Update a single entry in the remote index cache.
 
+    The change is batched in memory; see `flush_remote_index_cache`.
+
     Args:
         config: Boxyard config
         storage_location: Name of the storage location
         box_id: The box ID
         index_name: The remote index_name for this box
     """
-    cache = load_remote_index_cache(config, storage_location)
-    cache[box_id] = index_name
-    save_remote_index_cache(config, storage_location, cache)
+    apply_remote_index_cache_ops(config, storage_location, [(box_id, index_name)])
 
 # %%
 #|export
@@ -104,15 +390,14 @@ def remove_from_remote_index_cache(
     """
     Remove an entry from the remote index cache.
 
+    The change is batched in memory; see `flush_remote_index_cache`.
+
     Args:
         config: Boxyard config
         storage_location: Name of the storage location
         box_id: The box ID to remove
     """
-    cache = load_remote_index_cache(config, storage_location)
-    if box_id in cache:
-        del cache[box_id]
-        save_remote_index_cache(config, storage_location, cache)
+    apply_remote_index_cache_ops(config, storage_location, [(box_id, None)])
 
 # %% [markdown]
 # # Finding Remote Boxes by ID
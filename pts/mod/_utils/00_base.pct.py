@@ -64,10 +64,13 @@ show_doc(this_module.get_hostname)
 
 # %%
 #|export
+import functools
 import platform
 
 
+@functools.lru_cache(maxsize=1)
 def get_hostname():
+    # The hostname is stable for the life of the process, and on macOS looking it up spawns `scutil`
     system = platform.system()
     hostname = None
     if system == "Darwin":
@@ -133,8 +133,8 @@ try:
         if verbose:
             print("Renaming locally...")
 
-        # Update the boxmeta.toml
-        box_meta.name = new_name
+        # Update the boxmeta.toml (BoxMeta is frozen, so build a renamed copy)
+        box_meta = BoxMeta(**{**box_meta.model_dump(), "name": new_name})
 
         # Compute old and new local paths
         old_local_path = config.local_store_path / storage_location / box_index_name
@@ -19,6 +19,7 @@ from nblite import nbl_export, show_doc; nbl_export();
 # %%
 #|export
 from pathlib import Path
+import functools
 import textwrap
 import string
 from pydantic import BaseModel, ConfigDict
@@ -97,5 +98,23 @@ ENV_VAR_DEFAULT_BOX_GROUPS = "DEFAULT_BOX_GROUPS"
 
 # %%
 #|export
+@functools.cache
+def _cached_property_names(cls: type) -> tuple[str, ...]:
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name, attr in vars(klass).items()
+        if isinstance(attr, functools.cached_property)
+    )
+
+
 class StrictModel(BaseModel):
     model_config = ConfigDict(extra="forbid")
+
+    def model_copy(self, *, update=None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        # `cached_property` values live in the instance __dict__, which model_copy copies
+        # along with the fields; drop them so the copy derives them from its own fields
+        for name in _cached_property_names(type(self)):
+            copied.__dict__.pop(name, None)
+        return copied
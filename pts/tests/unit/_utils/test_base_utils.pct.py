@@ -104,6 +104,13 @@ from boxyard._utils import get_hostname
 class TestGetHostname:
     """Tests for get_hostname function."""
 
+    @pytest.fixture(autouse=True)
+    def clear_hostname_cache(self):
+        """get_hostname is cached, so each test must see a fresh lookup."""
+        get_hostname.cache_clear()
+        yield
+        get_hostname.cache_clear()
+
     def test_returns_string(self):
         """get_hostname returns a string."""
         result = get_hostname()
@@ -145,6 +152,14 @@ class TestGetHostname:
 
         assert result == "linux-host"
 
+    @patch("platform.system", return_value="Linux")
+    @patch("platform.node", return_value="linux-host")
+    def test_result_is_cached(self, mock_node, mock_system):
+        """Repeated calls reuse the first lookup."""
+        assert get_hostname() == get_hostname() == "linux-host"
+
+        mock_node.assert_called_once()
+
 
 # ============================================================================
 # Tests for check_last_time_modified
@@ -504,3 +519,36 @@ class TestSoftInterruptionHandling:
 
         # Cleanup
         base_module._interrupted = False
+
+
+# ============================================================================
+# Tests for the lazy _utils package exports
+# ============================================================================
+
+# %%
+#|export
+import importlib
+
+import boxyard._utils as utils_pkg
+
+
+class TestUtilsExportMap:
+    """Tests for the name -> submodule table behind boxyard._utils.__getattr__."""
+
+    @pytest.mark.parametrize("mod_path", [".base", ".locking", ".rclone"])
+    def test_export_map_covers_submodule_all(self, mod_path):
+        """Every public name of each submodule is resolvable from the package."""
+        mod = importlib.import_module(mod_path, "boxyard._utils")
+        for name in mod.__all__:
+            assert utils_pkg._EXPORT_MAP[name] == mod_path
+            assert getattr(utils_pkg, name) is getattr(mod, name)
+
+    def test_resolved_name_is_cached_on_module(self):
+        """After the first lookup the name is a plain module attribute."""
+        _ = utils_pkg.rclone_cat
+        assert "rclone_cat" in vars(utils_pkg)
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Names not in the table raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = utils_pkg.does_not_exist
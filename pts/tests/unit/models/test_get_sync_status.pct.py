@@ -912,3 +912,40 @@ class TestGetSyncStatusReturnValue:
             assert status.is_dir is True
 
         asyncio.run(_test())
+
+
+# ============================================================================
+# Tests for SyncStatus tuple-style access
+# ============================================================================
+
+# %%
+#|export
+class TestSyncStatusTupleAccess:
+    """Tests for the NamedTuple-compatible access on SyncStatus."""
+
+    def test_fields_match_dataclass_fields(self):
+        """_fields lists the dataclass fields in declaration order."""
+        import dataclasses
+
+        assert SyncStatus._fields == tuple(f.name for f in dataclasses.fields(SyncStatus))
+
+    def test_unpacking_indexing_and_asdict(self):
+        """A SyncStatus unpacks, indexes and converts like the NamedTuple it replaced."""
+        status = SyncStatus(
+            sync_condition=SyncCondition.SYNCED,
+            local_path_exists=True,
+            remote_path_exists=False,
+            local_sync_record=None,
+            remote_sync_record=None,
+            is_dir=True,
+        )
+
+        sync_condition, local_exists, remote_exists, *_, error_message = status
+        assert (sync_condition, local_exists, remote_exists) == (SyncCondition.SYNCED, True, False)
+        assert error_message is None
+        assert status[0] is SyncCondition.SYNCED
+        assert status[-2] is True
+        assert status[1:3] == (True, False)
+        assert status._asdict()["is_dir"] is True
+        with pytest.raises(IndexError):
+            status[len(SyncStatus._fields)]
@@ -15,10 +15,14 @@
 # %%
 #|export
 import pytest
+import re
 from pydantic import ValidationError
 
 from boxyard._models import BoxMeta, BoxyardMeta
 
+_MATCH_UNIQUE_PARENTS = re.compile("Parents must be unique")
+_MATCH_SELF_PARENT = re.compile("cannot be its own parent")
+
 
 # ============================================================================
 # Helper to create BoxMeta instances for testing
@@ -67,11 +71,11 @@ class TestBoxMetaParents:
         assert box.parents == ["20251122_bbbbb"]
 
     def test_duplicate_parents_rejected(self):
-        with pytest.raises(ValidationError, match="Parents must be unique"):
+        with pytest.raises(ValidationError, match=_MATCH_UNIQUE_PARENTS):
             _make_box("20251122", "aaaaa", "mybox", parents=["20251122_bbbbb", "20251122_bbbbb"])
 
     def test_self_parent_rejected(self):
-        with pytest.raises(ValidationError, match="cannot be its own parent"):
+        with pytest.raises(ValidationError, match=_MATCH_SELF_PARENT):
             _make_box("20251122", "aaaaa", "mybox", parents=["20251122_aaaaa"])
 
     def test_parents_in_model_dump(self):
@@ -151,6 +155,17 @@ class TestBoxyardMetaParentChild:
         anc_ids = {an.box_id for an in ancs}
         assert anc_ids == {a.box_id, b.box_id, c.box_id}
 
+    def test_model_copy_recomputes_indexes(self):
+        a = _make_box("20251122", "aaaaa", "box_a")
+        b = _make_box("20251122", "bbbbb", "box_b", parents=[a.box_id])
+        meta = BoxyardMeta(box_metas=[b])
+        assert meta.ancestors_of(b.box_id) == []
+
+        copied = meta.model_copy(update={"box_metas": [a, b]})
+        assert copied.ancestors_of(b.box_id) == [a]
+        assert copied.children_of(a.box_id) == [b]
+        assert meta.ancestors_of(b.box_id) == []
+
     def test_roots(self, simple_dag):
         meta, a, b, c = simple_dag
         roots = meta.roots()
@@ -197,6 +212,12 @@ class TestBoxyardMetaParentChild:
         meta2 = BoxyardMeta(box_metas=[*meta.box_metas, d])
         assert meta2.would_create_cycle(d.box_id, c.box_id) is False
 
+    def test_would_create_cycle_diamond(self, diamond_dag):
+        meta, a, b, c, d = diamond_dag
+        assert meta.would_create_cycle(a.box_id, d.box_id) is True
+        assert meta.would_create_cycle(b.box_id, c.box_id) is False
+        assert meta.would_create_cycle(d.box_id, a.box_id) is False
+
     def test_missing_parent_graceful(self):
         """Ancestors of a box whose parent doesn't exist locally."""
         box = _make_box("20251122", "aaaaa", "mybox", parents=["nonexistent_id"])
@@ -204,6 +225,15 @@ class TestBoxyardMetaParentChild:
         # Should not raise, just return empty
         assert meta.ancestors_of(box.box_id) == []
 
+    def test_missing_parent_partially_resolved(self):
+        """Known parents are still followed when another parent is missing."""
+        a = _make_box("20251122", "aaaaa", "box_a")
+        b = _make_box("20251122", "bbbbb", "box_b", parents=["nonexistent_id", a.box_id])
+        meta = BoxyardMeta(box_metas=[a, b])
+        assert [an.box_id for an in meta.ancestors_of(b.box_id)] == [a.box_id]
+        # The box's own parents list is left untouched
+        assert b.parents == ["nonexistent_id", a.box_id]
+
     def test_multiple_roots(self):
         a = _make_box("20251122", "aaaaa", "root1")
         b = _make_box("20251122", "bbbbb", "root2")
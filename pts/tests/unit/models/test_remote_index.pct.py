@@ -16,18 +16,38 @@
 #|export
 import pytest
 import json
+import os
+import time
 from pathlib import Path
-from unittest.mock import MagicMock, patch, AsyncMock
-import tempfile
-import shutil
+from types import SimpleNamespace
+from unittest.mock import patch, AsyncMock
 
 from boxyard._remote_index import (
     get_remote_index_cache_path,
     load_remote_index_cache,
+    load_all_remote_index_caches,
     save_remote_index_cache,
     update_remote_index_cache,
+    apply_remote_index_cache_ops,
     remove_from_remote_index_cache,
+    flush_remote_index_cache,
 )
+import boxyard._remote_index as remote_index_module
+
+
+@pytest.fixture
+def temp_dir(tmp_path):
+    """Per-test directory under pytest's session temp root (no per-test mkdtemp/rmtree)."""
+    yield tmp_path
+    # Drop this test's batched changes and memos instead of writing them into a
+    # directory that is thrown away, so teardown does no file I/O at all
+    remote_index_module._reset_remote_index_state()
+
+
+@pytest.fixture
+def cfg(temp_dir):
+    """Stand-in config; the cache functions only read `remote_indexes_path`."""
+    return SimpleNamespace(remote_indexes_path=temp_dir / "remote_indexes")
 
 
 # ============================================================================
@@ -41,20 +61,18 @@ class TestGetRemoteIndexCachePath:
 
     def test_returns_correct_path(self):
         """get_remote_index_cache_path returns path with storage location name."""
-        mock_config = MagicMock()
-        mock_config.remote_indexes_path = Path("/tmp/boxyard/remote_indexes")
+        config = SimpleNamespace(remote_indexes_path=Path("/tmp/boxyard/remote_indexes"))
 
-        path = get_remote_index_cache_path(mock_config, "my_remote")
+        path = get_remote_index_cache_path(config, "my_remote")
 
         assert path == Path("/tmp/boxyard/remote_indexes/my_remote.json")
 
     def test_different_storage_locations(self):
         """Different storage locations produce different paths."""
-        mock_config = MagicMock()
-        mock_config.remote_indexes_path = Path("/tmp/boxyard/remote_indexes")
+        config = SimpleNamespace(remote_indexes_path=Path("/tmp/boxyard/remote_indexes"))
 
-        path1 = get_remote_index_cache_path(mock_config, "remote1")
-        path2 = get_remote_index_cache_path(mock_config, "remote2")
+        path1 = get_remote_index_cache_path(config, "remote1")
+        path2 = get_remote_index_cache_path(config, "remote2")
 
         assert path1 != path2
         assert "remote1" in str(path1)
@@ -70,41 +88,63 @@ class TestGetRemoteIndexCachePath:
 class TestRemoteIndexCacheIO:
     """Tests for loading and saving remote index cache."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for tests."""
-        temp_path = tempfile.mkdtemp()
-        yield Path(temp_path)
-        shutil.rmtree(temp_path)
-
-    def test_load_nonexistent_returns_empty(self, temp_dir):
+    def test_load_nonexistent_returns_empty(self, cfg):
         """load_remote_index_cache returns empty dict if file doesn't exist."""
-        mock_config = MagicMock()
-        mock_config.remote_indexes_path = temp_dir / "remote_indexes"
-
-        cache = load_remote_index_cache(mock_config, "my_remote")
+        cache = load_remote_index_cache(cfg, "my_remote")
 
         assert cache == {}
 
-    def test_save_and_load_roundtrip(self, temp_dir):
+    def test_save_and_load_roundtrip(self, cfg):
         """save_remote_index_cache and load_remote_index_cache work together."""
-        mock_config = MagicMock()
-        mock_config.remote_indexes_path = temp_dir / "remote_indexes"
-
         test_cache = {
             "20251122_143022_a7kx9": "20251122_143022_a7kx9__myproject",
             "20251122_143022_b8ly0": "20251122_143022_b8ly0__otherproject",
         }
 
-        save_remote_index_cache(mock_config, "my_remote", test_cache)
-        loaded_cache = load_remote_index_cache(mock_config, "my_remote")
+        save_remote_index_cache(cfg, "my_remote", test_cache)
+        loaded_cache = load_remote_index_cache(cfg, "my_remote")
 
         assert loaded_cache == test_cache
 
+    def test_load_is_memoized_until_file_changes(self, cfg):
+        """Repeated loads reuse the parsed cache until the file is modified."""
+        save_remote_index_cache(cfg, "my_remote", {"id1": "id1__name1"})
+
+        with patch("boxyard._remote_index.json.loads") as mock_loads:
+            assert load_remote_index_cache(cfg, "my_remote") == {"id1": "id1__name1"}
+            mock_loads.assert_not_called()
+
+        # Modify the file outside of the module; the change must be picked up
+        cache_path = cfg.remote_indexes_path / "my_remote.json"
+        cache_path.write_text(json.dumps({"id1": "id1__name1", "id2": "id2__name2"}))
+        assert load_remote_index_cache(cfg, "my_remote") == {"id1": "id1__name1", "id2": "id2__name2"}
+
+    def test_load_sees_same_size_replacement_within_mtime_tick(self, cfg):
+        """A snapshot renamed over the old one is re-read even if size and mtime match."""
+        save_remote_index_cache(cfg, "my_remote", {"id1": "id1__foo"})
+        assert load_remote_index_cache(cfg, "my_remote") == {"id1": "id1__foo"}
+
+        # Another process renames the box and replaces the snapshot (temp file + rename)
+        cache_path = cfg.remote_indexes_path / "my_remote.json"
+        old_stat = cache_path.stat()
+        tmp_path = cfg.remote_indexes_path / "other.tmp"
+        tmp_path.write_text(cache_path.read_text().replace("foo", "bar"))
+        os.utime(tmp_path, ns=(old_stat.st_atime_ns, old_stat.st_mtime_ns))
+        os.replace(tmp_path, cache_path)
+
+        assert load_remote_index_cache(cfg, "my_remote") == {"id1": "id1__bar"}
+
+    def test_loaded_cache_is_a_copy(self, cfg):
+        """Mutating a loaded cache doesn't affect later loads."""
+        save_remote_index_cache(cfg, "my_remote", {"id1": "id1__name1"})
+
+        load_remote_index_cache(cfg, "my_remote")["id2"] = "id2__name2"
+
+        assert load_remote_index_cache(cfg, "my_remote") == {"id1": "id1__name1"}
+
     def test_save_creates_parent_directory(self, temp_dir):
         """save_remote_index_cache creates parent directories if needed."""
-        mock_config = MagicMock()
-        mock_config.remote_indexes_path = temp_dir / "nested" / "remote_indexes"
+        mock_config = SimpleNamespace(remote_indexes_path=temp_dir / "nested" / "remote_indexes")
 
         test_cache = {"id1": "id1__name1"}
 
@@ -115,20 +155,65 @@ class TestRemoteIndexCacheIO:
         cache_path = mock_config.remote_indexes_path / "my_remote.json"
         assert cache_path.exists()
 
-    def test_load_corrupted_file_returns_empty(self, temp_dir):
+    def test_save_leaves_no_temp_file(self, cfg):
+        """save_remote_index_cache writes atomically via a temp file that is renamed away."""
+        save_remote_index_cache(cfg, "my_remote", {"id1": "id1__name1"})
+        save_remote_index_cache(cfg, "my_remote", {"id2": "id2__name2"})
+
+        assert sorted(p.name for p in cfg.remote_indexes_path.iterdir()) == ["my_remote.json"]
+        assert load_remote_index_cache(cfg, "my_remote") == {"id2": "id2__name2"}
+
+    def test_load_corrupted_file_returns_empty(self, cfg):
         """load_remote_index_cache returns empty dict for corrupted JSON."""
-        mock_config = MagicMock()
-        mock_config.remote_indexes_path = temp_dir / "remote_indexes"
-        mock_config.remote_indexes_path.mkdir(parents=True)
+        cfg.remote_indexes_path.mkdir(parents=True)
 
         # Write invalid JSON
-        cache_path = mock_config.remote_indexes_path / "my_remote.json"
+        cache_path = cfg.remote_indexes_path / "my_remote.json"
         cache_path.write_text("not valid json {{{")
 
-        cache = load_remote_index_cache(mock_config, "my_remote")
+        cache = load_remote_index_cache(cfg, "my_remote")
 
         assert cache == {}
 
+    def test_load_undecodable_file_returns_empty(self, cfg):
+        """load_remote_index_cache returns empty dict for non-UTF-8 content."""
+        cfg.remote_indexes_path.mkdir(parents=True)
+
+        cache_path = cfg.remote_indexes_path / "my_remote.json"
+        cache_path.write_bytes(b'{"id1": "\xff\xfe"}')
+
+        assert load_remote_index_cache(cfg, "my_remote") == {}
+
+    @pytest.mark.parametrize("content", ['["id1", "id1__name1"]', '"id1"', "  ", "{truncated"])
+    def test_load_non_object_json_returns_empty(self, cfg, content):
+        """load_remote_index_cache rejects content that isn't a JSON object, without parsing it."""
+        cfg.remote_indexes_path.mkdir(parents=True)
+        cache_path = cfg.remote_indexes_path / "my_remote.json"
+        cache_path.write_text(content)
+
+        with patch("boxyard._remote_index.json.loads") as mock_loads:
+            assert load_remote_index_cache(cfg, "my_remote") == {}
+            mock_loads.assert_not_called()
+
+    def test_load_all_caches(self, cfg, monkeypatch):
+        """load_all_remote_index_caches loads every storage location's cache."""
+        monkeypatch.setattr(remote_index_module, "REMOTE_INDEX_CACHE_FLUSH_INTERVAL", 3600)
+
+        save_remote_index_cache(cfg, "remote_a", {"id1": "id1__name1"})
+        save_remote_index_cache(cfg, "remote_b", {"id2": "id2__name2"})
+        update_remote_index_cache(cfg, "remote_c", "id3", "id3__name3")  # Not yet flushed
+        (cfg.remote_indexes_path / "remote_d.json.tmp").write_text("{}")
+
+        assert load_all_remote_index_caches(cfg) == {
+            "remote_a": {"id1": "id1__name1"},
+            "remote_b": {"id2": "id2__name2"},
+            "remote_c": {"id3": "id3__name3"},
+        }
+
+    def test_load_all_caches_missing_directory(self, cfg):
+        """load_all_remote_index_caches returns empty dict if no cache was ever written."""
+        assert load_all_remote_index_caches(cfg) == {}
+
 
 # ============================================================================
 # Tests for update_remote_index_cache
@@ -139,36 +224,23 @@ class TestRemoteIndexCacheIO:
 class TestUpdateRemoteIndexCache:
     """Tests for the update_remote_index_cache function."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for tests."""
-        temp_path = tempfile.mkdtemp()
-        yield Path(temp_path)
-        shutil.rmtree(temp_path)
-
-    def test_update_adds_new_entry(self, temp_dir):
+    def test_update_adds_new_entry(self, cfg):
         """update_remote_index_cache adds a new entry to empty cache."""
-        mock_config = MagicMock()
-        mock_config.remote_indexes_path = temp_dir / "remote_indexes"
-
         update_remote_index_cache(
-            mock_config,
+            cfg,
             "my_remote",
             "20251122_143022_a7kx9",
             "20251122_143022_a7kx9__myproject",
         )
 
-        cache = load_remote_index_cache(mock_config, "my_remote")
+        cache = load_remote_index_cache(cfg, "my_remote")
         assert cache["20251122_143022_a7kx9"] == "20251122_143022_a7kx9__myproject"
 
-    def test_update_overwrites_existing_entry(self, temp_dir):
+    def test_update_overwrites_existing_entry(self, cfg):
         """update_remote_index_cache overwrites existing entry."""
-        mock_config = MagicMock()
-        mock_config.remote_indexes_path = temp_dir / "remote_indexes"
-
         # Add initial entry
         update_remote_index_cache(
-            mock_config,
+            cfg,
             "my_remote",
             "20251122_143022_a7kx9",
             "20251122_143022_a7kx9__oldname",
@@ -176,35 +248,32 @@ class TestUpdateRemoteIndexCache:
 
         # Update to new name
         update_remote_index_cache(
-            mock_config,
+            cfg,
             "my_remote",
             "20251122_143022_a7kx9",
             "20251122_143022_a7kx9__newname",
         )
 
-        cache = load_remote_index_cache(mock_config, "my_remote")
+        cache = load_remote_index_cache(cfg, "my_remote")
         assert cache["20251122_143022_a7kx9"] == "20251122_143022_a7kx9__newname"
 
-    def test_update_preserves_other_entries(self, temp_dir):
+    def test_update_preserves_other_entries(self, cfg):
         """update_remote_index_cache doesn't affect other entries."""
-        mock_config = MagicMock()
-        mock_config.remote_indexes_path = temp_dir / "remote_indexes"
-
         # Add two entries
         update_remote_index_cache(
-            mock_config,
+            cfg,
             "my_remote",
             "id1",
             "id1__name1",
         )
         update_remote_index_cache(
-            mock_config,
+            cfg,
             "my_remote",
             "id2",
             "id2__name2",
         )
 
-        cache = load_remote_index_cache(mock_config, "my_remote")
+        cache = load_remote_index_cache(cfg, "my_remote")
         assert len(cache) == 2
         assert cache["id1"] == "id1__name1"
         assert cache["id2"] == "id2__name2"
@@ -219,52 +288,245 @@ class TestUpdateRemoteIndexCache:
 class TestRemoveFromRemoteIndexCache:
     """Tests for the remove_from_remote_index_cache function."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for tests."""
-        temp_path = tempfile.mkdtemp()
-        yield Path(temp_path)
-        shutil.rmtree(temp_path)
-
-    def test_remove_existing_entry(self, temp_dir):
+    def test_remove_existing_entry(self, cfg):
         """remove_from_remote_index_cache removes an existing entry."""
-        mock_config = MagicMock()
-        mock_config.remote_indexes_path = temp_dir / "remote_indexes"
-
         # Add entries
         initial_cache = {"id1": "id1__name1", "id2": "id2__name2"}
-        save_remote_index_cache(mock_config, "my_remote", initial_cache)
+        save_remote_index_cache(cfg, "my_remote", initial_cache)
 
         # Remove one
-        remove_from_remote_index_cache(mock_config, "my_remote", "id1")
+        remove_from_remote_index_cache(cfg, "my_remote", "id1")
 
-        cache = load_remote_index_cache(mock_config, "my_remote")
+        cache = load_remote_index_cache(cfg, "my_remote")
         assert "id1" not in cache
         assert "id2" in cache
 
-    def test_remove_nonexistent_entry_is_safe(self, temp_dir):
+    def test_remove_nonexistent_entry_is_safe(self, cfg):
         """remove_from_remote_index_cache is safe for nonexistent entries."""
-        mock_config = MagicMock()
-        mock_config.remote_indexes_path = temp_dir / "remote_indexes"
-
         # Add entry
         initial_cache = {"id1": "id1__name1"}
-        save_remote_index_cache(mock_config, "my_remote", initial_cache)
+        save_remote_index_cache(cfg, "my_remote", initial_cache)
 
         # Remove nonexistent - should not raise
-        remove_from_remote_index_cache(mock_config, "my_remote", "nonexistent_id")
+        remove_from_remote_index_cache(cfg, "my_remote", "nonexistent_id")
 
-        cache = load_remote_index_cache(mock_config, "my_remote")
+        cache = load_remote_index_cache(cfg, "my_remote")
         assert cache == {"id1": "id1__name1"}
 
-    def test_remove_from_empty_cache_is_safe(self, temp_dir):
+    def test_remove_from_empty_cache_is_safe(self, cfg):
         """remove_from_remote_index_cache is safe for empty cache."""
-        mock_config = MagicMock()
-        mock_config.remote_indexes_path = temp_dir / "remote_indexes"
-
         # Remove from nonexistent cache - should not raise
-        remove_from_remote_index_cache(mock_config, "my_remote", "any_id")
+        remove_from_remote_index_cache(cfg, "my_remote", "any_id")
 
         # Cache should still be empty
-        cache = load_remote_index_cache(mock_config, "my_remote")
+        cache = load_remote_index_cache(cfg, "my_remote")
         assert cache == {}
+
+
+# ============================================================================
+# Tests for apply_remote_index_cache_ops
+# ============================================================================
+
+# %%
+#|export
+class TestApplyRemoteIndexCacheOps:
+    """Tests for applying several cache changes at once."""
+
+    def test_apply_ops_in_order(self, cfg):
+        """Sets and removals are applied in order; None removes an entry."""
+        save_remote_index_cache(cfg, "my_remote", {"id1": "id1__name1", "id2": "id2__name2"})
+
+        apply_remote_index_cache_ops(
+            cfg,
+            "my_remote",
+            [
+                ("id3", "id3__name3"),
+                ("id1", None),
+                ("id2", "id2__renamed"),
+                ("id3", None),
+                ("missing", None),
+            ],
+        )
+
+        assert load_remote_index_cache(cfg, "my_remote") == {"id2": "id2__renamed"}
+
+    def test_apply_batch_writes_once(self, cfg, monkeypatch):
+        """All ops reach the disk in a single write."""
+        monkeypatch.setattr(remote_index_module, "REMOTE_INDEX_CACHE_FLUSH_INTERVAL", 0)
+        cfg.remote_indexes_path.mkdir(parents=True)
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            apply_remote_index_cache_ops(
+                cfg, "my_remote", [(f"id{i}", f"id{i}__name{i}") for i in range(5)]
+            )
+
+        assert mock_open.call_count == 1
+        remote_index_module._reset_remote_index_state()
+        assert load_remote_index_cache(cfg, "my_remote") == {
+            f"id{i}": f"id{i}__name{i}" for i in range(5)
+        }
+
+
+# ============================================================================
+# Tests for batched cache writes
+# ============================================================================
+
+# %%
+#|export
+class TestBatchedRemoteIndexCacheWrites:
+    """Tests for the in-memory batching of single-entry cache updates."""
+
+    def test_updates_are_deferred_until_flush(self, cfg, monkeypatch):
+        """Updates within the flush interval are only written on flush."""
+        monkeypatch.setattr(remote_index_module, "REMOTE_INDEX_CACHE_FLUSH_INTERVAL", 3600)
+        cache_path = cfg.remote_indexes_path / "my_remote.json"
+
+        update_remote_index_cache(cfg, "my_remote", "id1", "id1__name1")
+        update_remote_index_cache(cfg, "my_remote", "id2", "id2__name2")
+        remove_from_remote_index_cache(cfg, "my_remote", "id1")
+
+        # Nothing on disk yet, but loads see the pending changes
+        assert not cache_path.exists()
+        assert not cache_path.with_suffix(".log").exists()
+        assert load_remote_index_cache(cfg, "my_remote") == {"id2": "id2__name2"}
+
+        flush_remote_index_cache()
+        assert json.loads(cache_path.read_text()) == {"id2": "id2__name2"}
+
+    def test_update_written_once_interval_elapsed(self, cfg, monkeypatch):
+        """Updates are written once the cache has been dirty for the flush interval."""
+        monkeypatch.setattr(remote_index_module, "REMOTE_INDEX_CACHE_FLUSH_INTERVAL", 0)
+        cache_path = cfg.remote_indexes_path / "my_remote.json"
+
+        update_remote_index_cache(cfg, "my_remote", "id1", "id1__name1")
+
+        assert cache_path.with_suffix(".log").read_text() == '{"op":"set","k":"id1","v":"id1__name1"}\n'
+
+    def test_pending_updates_are_flushed_by_timer(self, cfg, monkeypatch):
+        """Updates reach the disk after the flush interval even without further calls."""
+        monkeypatch.setattr(remote_index_module, "REMOTE_INDEX_CACHE_FLUSH_INTERVAL", 0.05)
+        log_path = cfg.remote_indexes_path / "my_remote.log"
+
+        update_remote_index_cache(cfg, "my_remote", "id1", "id1__name1")
+        assert not log_path.exists()
+
+        expected = '{"op":"set","k":"id1","v":"id1__name1"}\n'
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if log_path.exists() and log_path.read_text() == expected:
+                break
+            time.sleep(0.01)
+        assert log_path.read_text() == expected
+        # Nothing is left pending, so an explicit flush writes nothing more
+        flush_remote_index_cache()
+        assert log_path.read_text() == expected
+
+    def test_failed_flush_keeps_pending_updates(self, cfg, monkeypatch):
+        """Updates that fail to be written stay pending and are written by the next flush."""
+        monkeypatch.setattr(remote_index_module, "REMOTE_INDEX_CACHE_FLUSH_INTERVAL", 3600)
+
+        update_remote_index_cache(cfg, "my_remote", "id1", "id1__name1")
+        cfg.remote_indexes_path.write_text("")  # A file where the directory should be
+        with pytest.raises(OSError):
+            flush_remote_index_cache()
+        assert load_remote_index_cache(cfg, "my_remote") == {"id1": "id1__name1"}
+
+        cfg.remote_indexes_path.unlink()
+        flush_remote_index_cache()
+        assert (cfg.remote_indexes_path / "my_remote.log").read_text() == (
+            '{"op":"set","k":"id1","v":"id1__name1"}\n'
+        )
+
+    def test_save_supersedes_pending_updates(self, cfg, monkeypatch):
+        """An explicit save replaces any pending batched changes."""
+        monkeypatch.setattr(remote_index_module, "REMOTE_INDEX_CACHE_FLUSH_INTERVAL", 3600)
+
+        update_remote_index_cache(cfg, "my_remote", "id1", "id1__name1")
+        save_remote_index_cache(cfg, "my_remote", {"id2": "id2__name2"})
+        flush_remote_index_cache()
+
+        assert load_remote_index_cache(cfg, "my_remote") == {"id2": "id2__name2"}
+
+# %%
+#|export
+# ============================================================================
+# Tests for the remote index change log
+# ============================================================================
+
+
+class TestRemoteIndexChangeLog:
+    """Tests for the append-only change log and its compaction."""
+
+    @staticmethod
+    def _load_from_disk(cfg):
+        remote_index_module._reset_remote_index_state()
+        return load_remote_index_cache(cfg, "my_remote")
+
+    def test_updates_are_appended_to_log(self, cfg, monkeypatch):
+        """Flushed updates are appended to the log rather than rewriting the snapshot."""
+        monkeypatch.setattr(remote_index_module, "REMOTE_INDEX_CACHE_FLUSH_INTERVAL", 0)
+        cache_path = cfg.remote_indexes_path / "my_remote.json"
+
+        update_remote_index_cache(cfg, "my_remote", "id1", "id1__name1")
+        update_remote_index_cache(cfg, "my_remote", "id2", "id2__name2")
+
+        assert not cache_path.exists()
+        assert len(cache_path.with_suffix(".log").read_bytes().splitlines()) == 2
+        assert self._load_from_disk(cfg) == {
+            "id1": "id1__name1",
+            "id2": "id2__name2",
+        }
+
+    def test_log_is_replayed_over_snapshot(self, cfg):
+        """Log ops are applied over the snapshot in order, skipping torn lines."""
+        cache_path = cfg.remote_indexes_path / "my_remote.json"
+
+        save_remote_index_cache(cfg, "my_remote", {"id1": "id1__old", "id2": "id2__name2"})
+        cache_path.with_suffix(".log").write_text(
+            '{"op":"set","k":"id1","v":"id1__new"}\n'
+            '{"op":"del","k":"id2"}\n'
+            '{"op":"set","k":"id3"'
+        )
+
+        assert self._load_from_disk(cfg) == {"id1": "id1__new"}
+
+    def test_log_is_compacted(self, cfg, monkeypatch):
+        """The log is folded into the snapshot once it outgrows the cache."""
+        monkeypatch.setattr(remote_index_module, "REMOTE_INDEX_CACHE_FLUSH_INTERVAL", 0)
+        log_path = cfg.remote_indexes_path / "my_remote.log"
+
+        for i in range(10):
+            update_remote_index_cache(cfg, "my_remote", "id1", f"id1__name{i}")
+            assert not log_path.exists() or len(log_path.read_bytes().splitlines()) <= 2
+
+        assert self._load_from_disk(cfg) == {"id1": "id1__name9"}
+
+    def test_compaction_keeps_ops_appended_by_other_processes(self, cfg, monkeypatch):
+        """Compaction folds in log entries this process never loaded."""
+        log_path = cfg.remote_indexes_path / "my_remote.log"
+
+        update_remote_index_cache(cfg, "my_remote", "id1", "id1__name1")
+        flush_remote_index_cache()
+        # This process now holds a pending update based on what it loaded...
+        update_remote_index_cache(cfg, "my_remote", "id1", "id1__name2")
+        # ...while another process appends an entry of its own
+        with open(log_path, "ab") as f:
+            f.write(b'{"op":"set","k":"id2","v":"id2__other"}\n')
+        monkeypatch.setattr(remote_index_module, "REMOTE_INDEX_LOG_COMPACTION_FACTOR", 0)
+        flush_remote_index_cache()
+
+        assert not log_path.exists()
+        assert self._load_from_disk(cfg) == {
+            "id1": "id1__name2",
+            "id2": "id2__other",
+        }
+
+    def test_save_removes_log(self, cfg, monkeypatch):
+        """Saving writes a snapshot that supersedes the log."""
+        monkeypatch.setattr(remote_index_module, "REMOTE_INDEX_CACHE_FLUSH_INTERVAL", 0)
+
+        update_remote_index_cache(cfg, "my_remote", "id1", "id1__name1")
+        save_remote_index_cache(cfg, "my_remote", {"id2": "id2__name2"})
+
+        assert sorted(p.name for p in cfg.remote_indexes_path.iterdir()) == ["my_remote.json"]
+        assert self._load_from_disk(cfg) == {"id2": "id2__name2"}
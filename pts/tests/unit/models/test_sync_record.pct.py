@@ -15,6 +15,7 @@
 # %%
 #|export
 import pytest
+import json
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch, AsyncMock
@@ -56,6 +57,24 @@ class TestSyncRecordConstruction:
 
         assert record.ulid == explicit_ulid
 
+    def test_sync_record_is_frozen(self):
+        """SyncRecord fields cannot be reassigned."""
+        record = SyncRecord(sync_complete=False, syncer_hostname="host")
+
+        with pytest.raises(ValidationError):
+            record.sync_complete = True
+
+    def test_model_copy_recomputes_timestamp(self):
+        """A copy with a new ULID derives its timestamp from that ULID."""
+        record = SyncRecord(sync_complete=False, syncer_hostname="host")
+        _ = record.timestamp  # Populate the cached value
+        new_ulid = ULID.from_datetime(datetime(2020, 1, 1, tzinfo=timezone.utc))
+
+        copied = record.model_copy(update={"ulid": new_ulid})
+
+        assert copied.timestamp == new_ulid.datetime
+        assert record.timestamp == record.ulid.datetime
+
     def test_timestamp_auto_populated(self):
         """timestamp is auto-populated from ULID."""
         record = SyncRecord(
@@ -93,6 +112,22 @@ class TestSyncRecordConstruction:
                 syncer_hostname="testhost",
             )
 
+    def test_timestamp_mismatch_in_json_raises_error(self):
+        """A serialized timestamp that disagrees with the ULID is rejected."""
+        record = SyncRecord(sync_complete=True, syncer_hostname="testhost")
+        data = json.loads(record.model_dump_json())
+        data["timestamp"] = (record.timestamp + timedelta(hours=1)).isoformat()
+
+        with pytest.raises(ValidationError, match="timestamp"):
+            SyncRecord.model_validate_json(json.dumps(data))
+
+    def test_timestamp_is_derived_not_stored(self):
+        """timestamp is computed from the ULID but still included in dumps."""
+        record = SyncRecord(sync_complete=True, syncer_hostname="testhost")
+
+        assert "timestamp" not in SyncRecord.model_fields
+        assert record.model_dump()["timestamp"] == record.ulid.datetime
+
 
 # ============================================================================
 # Tests for SyncRecord.create factory method
@@ -103,6 +138,15 @@ class TestSyncRecordConstruction:
 class TestSyncRecordCreate:
     """Tests for the SyncRecord.create factory method."""
 
+    @pytest.fixture(autouse=True)
+    def clear_hostname_cache(self):
+        """Don't let a hostname cached by an earlier test mask the patches below."""
+        from boxyard._utils import get_hostname
+
+        get_hostname.cache_clear()
+        yield
+        get_hostname.cache_clear()
+
     def test_create_generates_new_record(self):
         """create() generates a new SyncRecord with ULID."""
         # get_hostname is imported via from ._utils import get_hostname
@@ -114,6 +158,17 @@ class TestSyncRecordCreate:
         assert record.sync_complete is True
         assert record.syncer_hostname == "autohost"
 
+    def test_create_unchecked_matches_validated_record(self):
+        """create_unchecked() builds the same record as the validating constructor."""
+        ulid = ULID()
+        unchecked = SyncRecord.create_unchecked(
+            ulid=ulid, sync_complete=True, syncer_hostname="host"
+        )
+        validated = SyncRecord(ulid=ulid, sync_complete=True, syncer_hostname="host")
+
+        assert unchecked == validated
+        assert unchecked.model_dump_json() == validated.model_dump_json()
+
     def test_create_with_explicit_hostname(self):
         """create() accepts explicit hostname."""
         record = SyncRecord.create(
@@ -144,12 +199,15 @@ class TestSyncRecordULID:
 
     def test_ulids_are_sortable_by_time(self):
         """ULIDs generated at different times are sortable."""
-        import time
-
-        records = []
-        for _ in range(3):
-            records.append(SyncRecord(sync_complete=True, syncer_hostname="host"))
-            time.sleep(0.002)  # Small delay to ensure different timestamps
+        t0 = datetime.now(timezone.utc)
+        records = [
+            SyncRecord(
+                ulid=ULID.from_datetime(t0 + timedelta(milliseconds=i)),
+                sync_complete=True,
+                syncer_hostname="host",
+            )
+            for i in range(3)
+        ]
 
         # ULIDs should be in ascending order
         for i in range(len(records) - 1):
@@ -173,6 +231,18 @@ class TestSyncRecordULID:
 
         assert len(set(str(u) for u in ulids)) == 100  # All unique
 
+    @pytest.mark.parametrize("n", [1, 2, 100])
+    def test_create_batch_ulids_are_unique_and_sorted(self, n):
+        """create_batch() yields unique ULIDs in creation order."""
+        records = SyncRecord.create_batch(n, sync_complete=True, syncer_hostname="host")
+        ulids = [r.ulid for r in records]
+
+        assert len(records) == n
+        assert len(set(ulids)) == n
+        assert ulids == sorted(ulids)
+        assert all(r.syncer_hostname == "host" and r.sync_complete for r in records)
+        assert all(r.timestamp == r.ulid.datetime for r in records)
+
 
 # ============================================================================
 # Tests for SyncRecord serialization
@@ -219,6 +289,7 @@ class TestSyncRecordSerialization:
         json_str = original.model_dump_json()
         restored = SyncRecord.model_validate_json(json_str)
 
+        assert restored == original
         assert str(restored.ulid) == str(original.ulid)
         assert restored.timestamp == original.timestamp
 
@@ -319,8 +390,22 @@ class TestSyncStatus:
         assert status.local_sync_record is None
         assert status.remote_sync_record is None
 
-    def test_sync_status_is_namedtuple(self):
-        """SyncStatus is a NamedTuple with correct field names."""
+    def test_sync_status_is_frozen(self):
+        """SyncStatus instances are immutable."""
+        status = SyncStatus(
+            sync_condition=SyncCondition.SYNCED,
+            local_path_exists=True,
+            remote_path_exists=True,
+            local_sync_record=None,
+            remote_sync_record=None,
+            is_dir=True,
+        )
+
+        with pytest.raises(AttributeError):
+            status.is_dir = False
+
+    def test_sync_status_fields(self):
+        """SyncStatus exposes its field names in order."""
         assert hasattr(SyncStatus, "_fields")
         fields = SyncStatus._fields
 
@@ -350,6 +435,27 @@ class TestSyncStatus:
         assert status[1] is True  # local_path_exists
         assert status[2] is True  # remote_path_exists
 
+    def test_sync_status_asdict(self):
+        """SyncStatus can be dumped to a dict keyed by field name."""
+        status = SyncStatus(
+            sync_condition=SyncCondition.NEEDS_PUSH,
+            local_path_exists=True,
+            remote_path_exists=False,
+            local_sync_record=None,
+            remote_sync_record=None,
+            is_dir=True,
+        )
+
+        assert status._asdict() == {
+            "sync_condition": SyncCondition.NEEDS_PUSH,
+            "local_path_exists": True,
+            "remote_path_exists": False,
+            "local_sync_record": None,
+            "remote_sync_record": None,
+            "is_dir": True,
+            "error_message": None,
+        }
+
 
 # ============================================================================
 # Tests for different sync scenarios
@@ -390,12 +496,17 @@ class TestSyncScenarios:
 
     def test_needs_pull_scenario(self):
         """NEEDS_PULL: remote has newer changes."""
-        local_record = SyncRecord(sync_complete=True, syncer_hostname="host1")
+        t0 = datetime.now(timezone.utc)
+        local_record = SyncRecord(
+            ulid=ULID.from_datetime(t0), sync_complete=True, syncer_hostname="host1"
+        )
 
         # Simulate a newer remote record
-        import time
-        time.sleep(0.002)
-        remote_record = SyncRecord(sync_complete=True, syncer_hostname="host2")
+        remote_record = SyncRecord(
+            ulid=ULID.from_datetime(t0 + timedelta(milliseconds=1)),
+            sync_complete=True,
+            syncer_hostname="host2",
+        )
 
         status = SyncStatus(
             sync_condition=SyncCondition.NEEDS_PULL,
@@ -16,9 +16,11 @@
 #|export
 import pytest
 import json
+import sys
 import inspect
 from pathlib import Path
 
+import boxyard._fast as _fast_module
 from boxyard._fast import BoxyardFast
 
 
@@ -40,7 +42,7 @@ def _make_meta_dict(timestamp, subid, name, groups=None, parents=None):
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def simple_data():
     """A -> B -> C chain."""
     a = _make_meta_dict("20251122", "aaaaa", "box_a")
@@ -49,7 +51,7 @@ def simple_data():
     return {"box_metas": [a, b, c]}
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def diamond_data():
     """A -> B, A -> C, B -> D, C -> D."""
     a = _make_meta_dict("20251122", "aaaaa", "box_a", groups=["g1"])
@@ -59,6 +61,17 @@ def diamond_data():
     return {"box_metas": [a, b, c, d]}
 
 
+# The query methods are read-only, so each test class shares one instance per dataset
+@pytest.fixture(scope="class")
+def fast_simple(simple_data):
+    return BoxyardFast(simple_data)
+
+
+@pytest.fixture(scope="class")
+def fast_diamond(diamond_data):
+    return BoxyardFast(diamond_data)
+
+
 # ============================================================================
 # Tests: No boxyard imports in module source
 # ============================================================================
@@ -92,6 +105,16 @@ class TestFromFile:
         fast = BoxyardFast.from_file(meta_path)
         assert len(fast._boxes) == 3
 
+    def test_repeated_strings_are_shared(self, tmp_path, diamond_data):
+        """Repeated values parsed from the file are interned to a single object."""
+        meta_path = tmp_path / "boxyard_meta.json"
+        meta_path.write_text(json.dumps(diamond_data))
+        fast = BoxyardFast.from_file(meta_path)
+        a, b = fast._boxes[0], fast._boxes[1]
+        assert a["storage_location"] is b["storage_location"]
+        assert a["creator_hostname"] is b["creator_hostname"]
+        assert a["groups"][0] is b["groups"][0]
+
     def test_backwards_compat_no_parents(self, tmp_path):
         """JSON without parents key still works."""
         data = {"box_metas": [
@@ -113,55 +136,71 @@ class TestFromFile:
 #|export
 class TestParentChildMethods:
 
-    def test_children_of(self, simple_data):
-        fast = BoxyardFast(simple_data)
-        children = fast.children_of("20251122_aaaaa")
+    def test_children_of(self, fast_simple):
+        children = fast_simple.children_of("20251122_aaaaa")
         assert len(children) == 1
         assert children[0]["box_id"] == "20251122_bbbbb"
 
-    def test_descendants_of(self, simple_data):
-        fast = BoxyardFast(simple_data)
-        descs = fast.descendants_of("20251122_aaaaa")
+    def test_descendants_of(self, fast_simple):
+        descs = fast_simple.descendants_of("20251122_aaaaa")
         desc_ids = {d["box_id"] for d in descs}
         assert desc_ids == {"20251122_bbbbb", "20251122_ccccc"}
 
-    def test_parents_of(self, simple_data):
-        fast = BoxyardFast(simple_data)
-        parents = fast.parents_of("20251122_bbbbb")
+    def test_traversals_are_nearest_first(self):
+        """descendants_of / ancestors_of return boxes in BFS order, not file order."""
+        a = _make_meta_dict("20251122", "aaaaa", "box_a")
+        b = _make_meta_dict("20251122", "bbbbb", "box_b", parents=["20251122_aaaaa"])
+        c = _make_meta_dict("20251122", "ccccc", "box_c", parents=["20251122_bbbbb"])
+        fast = BoxyardFast({"box_metas": [c, b, a]})
+        assert [d["box_id"] for d in fast.descendants_of("20251122_aaaaa")] == ["20251122_bbbbb", "20251122_ccccc"]
+        assert [d["box_id"] for d in fast.iter_descendants_of("20251122_aaaaa")] == ["20251122_bbbbb", "20251122_ccccc"]
+        assert [d["box_id"] for d in fast.ancestors_of("20251122_ccccc")] == ["20251122_bbbbb", "20251122_aaaaa"]
+
+    def test_parents_of(self, fast_simple):
+        parents = fast_simple.parents_of("20251122_bbbbb")
         assert len(parents) == 1
         assert parents[0]["box_id"] == "20251122_aaaaa"
 
-    def test_ancestors_of(self, simple_data):
-        fast = BoxyardFast(simple_data)
-        ancs = fast.ancestors_of("20251122_ccccc")
+    def test_ancestors_of(self, fast_simple):
+        ancs = fast_simple.ancestors_of("20251122_ccccc")
         anc_ids = {a["box_id"] for a in ancs}
         assert anc_ids == {"20251122_aaaaa", "20251122_bbbbb"}
 
-    def test_roots(self, simple_data):
-        fast = BoxyardFast(simple_data)
-        roots = fast.roots()
+    def test_read_only_queries_return_tuples(self, fast_simple):
+        for result in (fast_simple.children_of("20251122_aaaaa"), fast_simple.parents_of("20251122_bbbbb"),
+                       fast_simple.descendants_of("20251122_aaaaa"), fast_simple.ancestors_of("20251122_ccccc"),
+                       fast_simple.roots(), fast_simple.leaves(), fast_simple.boxes_by_group("g1")):
+            assert isinstance(result, tuple)
+
+    def test_roots(self, fast_simple):
+        roots = fast_simple.roots()
         assert len(roots) == 1
         assert roots[0]["box_id"] == "20251122_aaaaa"
 
-    def test_leaves(self, simple_data):
-        fast = BoxyardFast(simple_data)
-        leaves = fast.leaves()
+    def test_leaves(self, fast_simple):
+        leaves = fast_simple.leaves()
         assert len(leaves) == 1
         assert leaves[0]["box_id"] == "20251122_ccccc"
 
-    def test_is_ancestor(self, simple_data):
+    def test_roots_and_leaves_repeat_calls(self, simple_data):
         fast = BoxyardFast(simple_data)
-        assert fast.is_ancestor("20251122_ccccc", "20251122_aaaaa") is True
-        assert fast.is_ancestor("20251122_aaaaa", "20251122_ccccc") is False
+        assert fast.roots() == fast.roots()
+        assert fast.leaves() == fast.leaves()
+        fast.roots()[0]["name"] = "changed"  # Must not affect later calls
+        fast.leaves()[0]["groups"].append("changed")
+        assert [(r["box_id"], r["name"]) for r in fast.roots()] == [("20251122_aaaaa", "box_a")]
+        assert [(r["box_id"], r["groups"]) for r in fast.leaves()] == [("20251122_ccccc", [])]
 
-    def test_is_descendant(self, simple_data):
-        fast = BoxyardFast(simple_data)
-        assert fast.is_descendant("20251122_aaaaa", "20251122_ccccc") is True
-        assert fast.is_descendant("20251122_ccccc", "20251122_aaaaa") is False
+    def test_is_ancestor(self, fast_simple):
+        assert fast_simple.is_ancestor("20251122_ccccc", "20251122_aaaaa") is True
+        assert fast_simple.is_ancestor("20251122_aaaaa", "20251122_ccccc") is False
 
-    def test_has_cycle_no_cycle(self, simple_data):
-        fast = BoxyardFast(simple_data)
-        assert fast.has_cycle() is False
+    def test_is_descendant(self, fast_simple):
+        assert fast_simple.is_descendant("20251122_aaaaa", "20251122_ccccc") is True
+        assert fast_simple.is_descendant("20251122_ccccc", "20251122_aaaaa") is False
+
+    def test_has_cycle_no_cycle(self, fast_simple):
+        assert fast_simple.has_cycle() is False
 
     def test_has_cycle_with_cycle(self):
         data = {"box_metas": [
@@ -171,20 +210,54 @@ class TestParentChildMethods:
         fast = BoxyardFast(data)
         assert fast.has_cycle() is True
 
-    def test_would_create_cycle(self, simple_data):
-        fast = BoxyardFast(simple_data)
-        assert fast.would_create_cycle("20251122_aaaaa", "20251122_ccccc") is True
-        assert fast.would_create_cycle("20251122_aaaaa", "20251122_aaaaa") is True
+    def test_has_cycle_diamond_is_acyclic(self, fast_diamond):
+        assert fast_diamond.has_cycle() is False
 
-    def test_would_not_create_cycle(self, simple_data):
-        fast = BoxyardFast(simple_data)
+    def test_has_cycle_below_root(self):
+        data = {"box_metas": [
+            _make_meta_dict("20251122", "aaaaa", "a"),
+            _make_meta_dict("20251122", "bbbbb", "b", parents=["20251122_aaaaa", "20251122_ccccc"]),
+            _make_meta_dict("20251122", "ccccc", "c", parents=["20251122_bbbbb"]),
+        ]}
+        fast = BoxyardFast(data)
+        assert fast.has_cycle() is True
+
+    def test_would_create_cycle(self, fast_simple):
+        assert fast_simple.would_create_cycle("20251122_aaaaa", "20251122_ccccc") is True
+        assert fast_simple.would_create_cycle("20251122_aaaaa", "20251122_aaaaa") is True
+
+    def test_would_not_create_cycle(self, fast_simple):
         # Adding aaaaa as parent of ccccc is fine (already is ancestor)
         # But adding a new unrelated box as parent is fine
-        assert fast.would_create_cycle("20251122_ccccc", "20251122_aaaaa") is False
+        assert fast_simple.would_create_cycle("20251122_ccccc", "20251122_aaaaa") is False
 
-    def test_diamond_no_duplicates(self, diamond_data):
-        fast = BoxyardFast(diamond_data)
-        descs = fast.descendants_of("20251122_aaaaa")
+    def test_reachability_through_cycle(self):
+        data = {"box_metas": [
+            _make_meta_dict("20251122", "aaaaa", "a", parents=["20251122_ccccc"]),
+            _make_meta_dict("20251122", "bbbbb", "b", parents=["20251122_aaaaa"]),
+            _make_meta_dict("20251122", "ccccc", "c", parents=["20251122_bbbbb"]),
+            _make_meta_dict("20251122", "ddddd", "d", parents=["20251122_ccccc"]),
+        ]}
+        fast = BoxyardFast(data)
+        desc_ids = {d["box_id"] for d in fast.descendants_of("20251122_aaaaa")}
+        assert desc_ids == {"20251122_aaaaa", "20251122_bbbbb", "20251122_ccccc", "20251122_ddddd"}
+        assert fast.is_ancestor("20251122_ddddd", "20251122_bbbbb") is True
+        assert fast.is_descendant("20251122_ddddd", "20251122_aaaaa") is False
+
+    def test_descendants_of_missing_parent(self):
+        """A parent id that isn't a known box still resolves to its children's subtrees."""
+        data = {"box_metas": [
+            _make_meta_dict("20251122", "bbbbb", "b", parents=["20251122_zzzzz"]),
+            _make_meta_dict("20251122", "ccccc", "c", parents=["20251122_bbbbb"]),
+        ]}
+        fast = BoxyardFast(data)
+        desc_ids = {d["box_id"] for d in fast.descendants_of("20251122_zzzzz")}
+        assert desc_ids == {"20251122_bbbbb", "20251122_ccccc"}
+        assert fast.is_descendant("20251122_zzzzz", "20251122_ccccc") is True
+        assert fast.ancestors_of("20251122_zzzzz") == ()
+
+    def test_diamond_no_duplicates(self, fast_diamond):
+        descs = fast_diamond.descendants_of("20251122_aaaaa")
         desc_ids = [d["box_id"] for d in descs]
         assert desc_ids.count("20251122_ddddd") == 1
         assert set(desc_ids) == {"20251122_bbbbb", "20251122_ccccc", "20251122_ddddd"}
@@ -198,27 +271,68 @@ class TestParentChildMethods:
 #|export
 class TestGroupFilter:
 
-    def test_children_of_with_group_filter(self, diamond_data):
-        fast = BoxyardFast(diamond_data)
-        children = fast.children_of("20251122_aaaaa", groups={"g1"})
+    def test_children_of_with_group_filter(self, fast_diamond):
+        children = fast_diamond.children_of("20251122_aaaaa", groups={"g1"})
         assert len(children) == 1
         assert children[0]["box_id"] == "20251122_bbbbb"
 
-    def test_roots_with_group_filter(self, diamond_data):
-        fast = BoxyardFast(diamond_data)
-        roots = fast.roots(groups={"g2"})
+    def test_roots_with_group_filter(self, fast_diamond):
+        roots = fast_diamond.roots(groups={"g2"})
         # C is in g2 and has a parent (A), so it's not a root
         # But A is a root and not in g2, so with filter only C appears... but C has a parent
         # Actually roots() returns boxes with parents==[], which is only A.
         # A is not in g2, so filtered result is empty
         assert len(roots) == 0
 
-    def test_descendants_with_group_filter(self, diamond_data):
-        fast = BoxyardFast(diamond_data)
-        descs = fast.descendants_of("20251122_aaaaa", groups={"g2"})
+    def test_descendants_with_group_filter(self, fast_diamond):
+        descs = fast_diamond.descendants_of("20251122_aaaaa", groups={"g2"})
         desc_ids = {d["box_id"] for d in descs}
         assert desc_ids == {"20251122_ccccc", "20251122_ddddd"}
 
+    def test_ancestors_with_group_filter(self, fast_diamond):
+        ancs = fast_diamond.ancestors_of("20251122_ddddd", groups={"g2", "g3"})
+        assert {a["box_id"] for a in ancs} == {"20251122_ccccc"}
+        assert fast_diamond.ancestors_of("20251122_ddddd", groups={"g3"}) == ()
+
+    def test_group_filter_is_interned(self, diamond_data):
+        """Group names passed in are normalized to the interned names used in the metadata."""
+        fast = BoxyardFast(diamond_data)
+        g1 = "".join(["g", "1"])  # Built at runtime, so a different object from the interned name
+        assert g1 is not sys.intern("g1")
+        children = fast.children_of("20251122_aaaaa", groups=[g1])
+        assert [c["box_id"] for c in children] == ["20251122_bbbbb"]
+        assert children[0]["groups"][0] is sys.intern("g1")
+        assert fast.children_of("20251122_aaaaa", groups={"g1"}) == children
+        assert [p["box_id"] for p in fast.parents_of("20251122_ddddd", groups=[g1])] == ["20251122_bbbbb"]
+
+    def test_filtered_queries_are_memoized(self, diamond_data):
+        fast = BoxyardFast(diamond_data)
+        first = fast.descendants_of("20251122_aaaaa", groups={"g2"})
+        first[0]["name"] = "changed"  # Must not affect later calls
+        descs = fast.descendants_of("20251122_aaaaa", groups=["g2"])
+        assert descs[0]["name"] == "box_c"
+        assert [d["box_id"] for d in descs] == ["20251122_ccccc", "20251122_ddddd"]
+        assert descs == fast.descendants_of("20251122_aaaaa", groups=frozenset({"g2"}))
+
+    def test_queries_accept_keyword_arguments(self, fast_diamond):
+        for method in (fast_diamond.children_of, fast_diamond.descendants_of,
+                       fast_diamond.parents_of, fast_diamond.ancestors_of):
+            assert method(box_id="20251122_bbbbb", groups={"g1", "g2"}) == method("20251122_bbbbb", {"g1", "g2"})
+
+    def test_query_cache_is_bounded(self, diamond_data, monkeypatch):
+        monkeypatch.setattr(_fast_module, "_QUERY_CACHE_MAXSIZE", 2)
+        fast = BoxyardFast(diamond_data)
+        for box_id in ("20251122_aaaaa", "20251122_bbbbb", "20251122_ccccc", "20251122_ddddd"):
+            fast.children_of(box_id)
+        assert len(fast._query_cache) == 2
+        assert [c["box_id"] for c in fast.children_of("20251122_aaaaa")] == ["20251122_bbbbb", "20251122_ccccc"]
+
+    def test_iter_descendants_of(self, fast_diamond):
+        """The generator yields the same results as descendants_of, in the same order."""
+        assert tuple(fast_diamond.iter_descendants_of("20251122_aaaaa")) == fast_diamond.descendants_of("20251122_aaaaa")
+        filtered = fast_diamond.iter_descendants_of("20251122_aaaaa", groups={"g2"})
+        assert [d["box_id"] for d in filtered] == ["20251122_ccccc", "20251122_ddddd"]
+
 
 # ============================================================================
 # Tests: Group queries
@@ -228,23 +342,23 @@ class TestGroupFilter:
 #|export
 class TestGroupQueries:
 
-    def test_groups_of(self, diamond_data):
-        fast = BoxyardFast(diamond_data)
-        assert fast.groups_of("20251122_ddddd") == ["g1", "g2"]
+    def test_groups_of(self, fast_diamond):
+        assert fast_diamond.groups_of("20251122_ddddd") == ["g1", "g2"]
 
-    def test_boxes_by_group(self, diamond_data):
-        fast = BoxyardFast(diamond_data)
-        g1_boxes = fast.boxes_by_group("g1")
+    def test_boxes_by_group(self, fast_diamond):
+        g1_boxes = fast_diamond.boxes_by_group("g1")
         g1_ids = {b["box_id"] for b in g1_boxes}
         assert g1_ids == {"20251122_aaaaa", "20251122_bbbbb", "20251122_ddddd"}
 
-    def test_all_groups(self, diamond_data):
-        fast = BoxyardFast(diamond_data)
-        assert fast.all_groups() == ["g1", "g2"]
+    def test_unknown_group_and_box(self, fast_diamond):
+        assert fast_diamond.boxes_by_group("nope") == ()
+        assert fast_diamond.groups_of("20251122_zzzzz") == []
 
-    def test_all_boxes_with_groups(self, diamond_data):
-        fast = BoxyardFast(diamond_data)
-        result = fast.all_boxes_with_groups()
+    def test_all_groups(self, fast_diamond):
+        assert fast_diamond.all_groups() == ["g1", "g2"]
+
+    def test_all_boxes_with_groups(self, fast_diamond):
+        result = fast_diamond.all_boxes_with_groups()
         assert "20251122_aaaaa__box_a" in result
         assert result["20251122_ddddd__box_d"] == ["g1", "g2"]
 
@@ -257,16 +371,27 @@ class TestGroupQueries:
 #|export
 class TestDAG:
 
-    def test_get_dag_structure(self, simple_data):
-        fast = BoxyardFast(simple_data)
-        dag = fast.get_dag()
+    def test_get_dag_structure(self, fast_simple):
+        dag = fast_simple.get_dag()
         assert set(dag.keys()) == {"20251122_aaaaa", "20251122_bbbbb", "20251122_ccccc"}
         assert dag["20251122_aaaaa"]["children"] == ["20251122_bbbbb"]
         assert dag["20251122_bbbbb"]["parents"] == ["20251122_aaaaa"]
 
-    def test_get_dag_nested_from_roots(self, simple_data):
-        fast = BoxyardFast(simple_data)
-        nested = fast.get_dag_nested()
+    def test_get_dag_repeat_calls_are_independent(self, fast_simple):
+        dag = fast_simple.get_dag()
+        assert json.loads(json.dumps(dag)) == dag
+        # Editing a result must not affect later calls or the other queries
+        dag["20251122_aaaaa"]["groups"].append("g9")
+        dag["20251122_aaaaa"]["children"].clear()
+        dag["20251122_zzzzz"] = {}
+        assert fast_simple.get_dag() != dag
+        assert "g9" not in fast_simple.groups_of("20251122_aaaaa")
+        assert "g9" not in fast_simple.all_groups()
+        assert not fast_simple.boxes_by_group("g9")
+        assert fast_simple.get_dag()["20251122_aaaaa"]["children"] == ["20251122_bbbbb"]
+
+    def test_get_dag_nested_from_roots(self, fast_simple):
+        nested = fast_simple.get_dag_nested()
         assert "20251122_aaaaa" in nested
         root = nested["20251122_aaaaa"]
         assert root["name"] == "box_a"
@@ -274,8 +399,31 @@ class TestDAG:
         child_b = root["children"]["20251122_bbbbb"]
         assert "20251122_ccccc" in child_b["children"]
 
-    def test_get_dag_nested_from_specific_root(self, simple_data):
-        fast = BoxyardFast(simple_data)
-        nested = fast.get_dag_nested(root_id="20251122_bbbbb")
+    def test_get_dag_nested_repeat_calls_are_independent(self, fast_diamond):
+        first = fast_diamond.get_dag_nested()
+        first["20251122_aaaaa"]["children"].clear()  # Must not affect later calls
+        assert fast_diamond.get_dag_nested() != first
+        sub = fast_diamond.get_dag_nested("20251122_bbbbb")
+        assert sub == fast_diamond.get_dag_nested("20251122_bbbbb")
+        assert list(sub["20251122_bbbbb"]["children"]) == ["20251122_ddddd"]
+        # The diamond's shared child still appears only once in the full tree
+        root = fast_diamond.get_dag_nested()["20251122_aaaaa"]
+        assert "20251122_ddddd" in root["children"]["20251122_bbbbb"]["children"]
+        assert root["children"]["20251122_ccccc"]["children"] == {}
+
+    def test_get_dag_nested_deep_chain(self):
+        """Deep hierarchies don't hit the recursion limit."""
+        depth = 3000
+        metas = [_make_meta_dict("20251122", f"{i:05d}", f"box_{i}",
+                                 parents=[f"20251122_{i - 1:05d}"] if i else None)
+                 for i in range(depth)]
+        fast = BoxyardFast({"box_metas": metas})
+        node = fast.get_dag_nested()["20251122_00000"]
+        for _ in range(depth - 1):
+            (node,) = node["children"].values()
+        assert node["box_id"] == f"20251122_{depth - 1:05d}"
+
+    def test_get_dag_nested_from_specific_root(self, fast_simple):
+        nested = fast_simple.get_dag_nested(root_id="20251122_bbbbb")
         assert "20251122_bbbbb" in nested
         assert "20251122_aaaaa" not in nested
@@ -1,15 +1,19 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: pts/mod/_models.pct.py
 
-__all__ = ['BoxMeta', 'BoxyardMeta', 'SyncCondition', 'SyncRecord', 'SyncStatus', 'create_boxyard_meta', 'create_user_box_group_symlinks', 'generate_unique_box_id', 'get_box_group_configs', 'get_boxyard_meta', 'get_sync_status', 'refresh_boxyard_meta']
+__all__ = ['BoxMeta', 'BoxyardMeta', 'SyncCondition', 'SyncRecord', 'SyncStatus', 'create_boxyard_meta', 'create_user_box_group_symlinks', 'generate_unique_box_id', 'get_box_group_configs', 'get_boxyard_meta', 'get_remote_box_part_path', 'get_remote_box_path', 'get_remote_box_sync_record_path', 'get_sync_status', 'refresh_boxyard_meta']
 
 # %% pts/mod/_models.pct.py 3
-from pydantic import Field, model_validator
-from pathlib import Path
+from pydantic import ConfigDict, Field, TypeAdapter, computed_field, model_validator
+from pathlib import Path, PurePosixPath
 import toml
 from datetime import datetime, timezone
+import os
 import random
+import time
 from ulid import ULID
 from enum import Enum
+from functools import cached_property
+from collections import deque
 import boxyard.config
 from . import const
 from .config import BoxGroupConfig, BoxTimestampFormat
@@ -18,10 +22,66 @@ from .config import BoxGroupConfig, BoxTimestampFormat
 from ._enums import BoxPart
 
 # %% pts/mod/_models.pct.py 6
+_BOX_PART_REL_PATHS = {
+    BoxPart.DATA: const.BOX_DATA_REL_PATH,
+    BoxPart.META: const.BOX_METAFILE_REL_PATH,
+    BoxPart.CONF: const.BOX_CONF_REL_PATH,
+}
+
+# %% pts/mod/_models.pct.py 7
+# Remote paths are rclone paths, so they're always POSIX regardless of platform.
+# They are keyed by index name rather than `BoxMeta` because a box may be synced
+# against a remote copy stored under a different name.
+def get_remote_box_path(
+    config: boxyard.config.Config, storage_location: str, index_name: str
+) -> PurePosixPath:
+    return PurePosixPath(
+        config.storage_locations[storage_location].store_path.as_posix(),
+        const.REMOTE_BOXES_REL_PATH,
+        index_name,
+    )
+
+
+def get_remote_box_part_path(
+    config: boxyard.config.Config,
+    storage_location: str,
+    index_name: str,
+    box_part: BoxPart,
+) -> PurePosixPath:
+    rel_path = _BOX_PART_REL_PATHS.get(box_part)
+    if rel_path is None:
+        raise ValueError(f"Invalid box part: {box_part}")
+    return get_remote_box_path(config, storage_location, index_name) / rel_path
+
+
+def get_remote_box_sync_record_path(
+    config: boxyard.config.Config,
+    storage_location: str,
+    index_name: str,
+    box_part: BoxPart,
+) -> PurePosixPath:
+    return PurePosixPath(
+        config.storage_locations[storage_location].store_path.as_posix(),
+        const.SYNC_RECORDS_REL_PATH,
+        index_name,
+        f"{box_part.value}.rec",
+    )
+
+# %% pts/mod/_models.pct.py 8
+def _check_unique(values: list[str], label: str) -> None:
+    """Raise on the first duplicate in `values` (single pass, short-circuits)."""
+    seen = set()
+    add = seen.add
+    for value in values:
+        if value in seen:
+            raise ValueError(f"{label} must be unique.")
+        add(value)
+
+# %% pts/mod/_models.pct.py 9
 def _create_box_subid(character_set: str, length: int) -> str:
     return "".join(random.choices(character_set, k=length))
 
-# %% pts/mod/_models.pct.py 7
+# %% pts/mod/_models.pct.py 10
 def generate_unique_box_id(
     config: boxyard.config.Config,
     existing_ids: set[str],
@@ -70,8 +130,11 @@ def generate_unique_box_id(
         f"This should be extremely rare - please report this issue."
     )
 
-# %% pts/mod/_models.pct.py 8
+# %% pts/mod/_models.pct.py 11
 class BoxMeta(const.StrictModel):
+    # Frozen so that the cached properties below can never go stale (model_copy drops them)
+    model_config = ConfigDict(frozen=True)
+
     creation_timestamp_utc: str
     box_subid: str
     name: str
@@ -126,24 +189,33 @@ class BoxMeta(const.StrictModel):
             parents=parents or [],
         )
 
-    @property
+    @cached_property
     def creation_timestamp_datetime(self) -> datetime:
-        if "_" in self.creation_timestamp_utc:
-            return datetime.strptime(
-                self.creation_timestamp_utc, const.BOX_TIMESTAMP_FORMAT
+        # Hand-rolled parse of `YYYYMMDD` / `YYYYMMDD_HHMMSS` (much faster than `strptime`)
+        s = self.creation_timestamp_utc
+        if len(s) == 8 and s.isdigit():
+            return datetime(int(s[0:4]), int(s[4:6]), int(s[6:8]))
+        elif len(s) == 15 and s[8] == "_" and s[:8].isdigit() and s[9:].isdigit():
+            return datetime(
+                int(s[0:4]),
+                int(s[4:6]),
+                int(s[6:8]),
+                int(s[9:11]),
+                int(s[11:13]),
+                int(s[13:15]),
             )
         else:
-            return datetime.strptime(
-                self.creation_timestamp_utc, const.BOX_TIMESTAMP_FORMAT_DATE_ONLY
-            )
+            raise ValueError(f"Invalid creation timestamp: '{s}'")
 
     @property
     def box_id(self) -> str:
         return f"{self.creation_timestamp_utc}_{str(self.box_subid)}"
 
-    @property
+    @cached_property
     def index_name(self) -> str:
-        return f"{self.box_id}__{self.name}"
+        return "".join(
+            (self.creation_timestamp_utc, "_", self.box_subid, "__", self.name)
+        )
 
     @classmethod
     def parse_index_name(cls, index_name: str) -> tuple[str, str]:
@@ -163,49 +235,35 @@ class BoxMeta(const.StrictModel):
     ) -> boxyard.config.StorageConfig:
         return config.storage_locations[self.storage_location]
 
-    def get_remote_path(self, config: boxyard.config.Config) -> Path:
-        return (
-            config.storage_locations[self.storage_location].store_path
-            / const.REMOTE_BOXES_REL_PATH
-            / self.index_name
-        )
+    def get_remote_path(self, config: boxyard.config.Config) -> PurePosixPath:
+        return get_remote_box_path(config, self.storage_location, self.index_name)
 
     def get_local_path(self, config: boxyard.config.Config) -> Path:
         return config.local_store_path / self.storage_location / self.index_name
 
     def get_remote_part_path(
         self, config: boxyard.config.Config, box_part: BoxPart
-    ) -> Path:
-        if box_part == BoxPart.DATA:
-            return self.get_remote_path(config) / const.BOX_DATA_REL_PATH
-        elif box_part == BoxPart.META:
-            return self.get_remote_path(config) / const.BOX_METAFILE_REL_PATH
-        elif box_part == BoxPart.CONF:
-            return self.get_remote_path(config) / const.BOX_CONF_REL_PATH
-        else:
-            raise ValueError(f"Invalid box part: {box_part}")
+    ) -> PurePosixPath:
+        return get_remote_box_part_path(
+            config, self.storage_location, self.index_name, box_part
+        )
 
     def get_local_part_path(
         self, config: boxyard.config.Config, box_part: BoxPart
     ) -> Path:
         if box_part == BoxPart.DATA:
+            # The data of included boxes lives in the user's boxes folder
             return config.user_boxes_path / self.index_name
-        elif box_part == BoxPart.META:
-            return self.get_local_path(config) / const.BOX_METAFILE_REL_PATH
-        elif box_part == BoxPart.CONF:
-            return self.get_local_path(config) / const.BOX_CONF_REL_PATH
-        else:
+        rel_path = _BOX_PART_REL_PATHS.get(box_part)
+        if rel_path is None:
             raise ValueError(f"Invalid box part: {box_part}")
+        return self.get_local_path(config) / rel_path
 
     def get_remote_sync_record_path(
         self, config: boxyard.config.Config, box_part: BoxPart
-    ) -> Path:
-        sl_conf = self.get_storage_location_config(config)
-        return (
-            sl_conf.store_path
-            / const.SYNC_RECORDS_REL_PATH
-            / self.index_name
-            / f"{box_part.value}.rec"
+    ) -> PurePosixPath:
+        return get_remote_box_sync_record_path(
+            config, self.storage_location, self.index_name, box_part
         )
 
     def get_local_sync_record_path(
@@ -286,14 +344,12 @@ class BoxMeta(const.StrictModel):
 
     @model_validator(mode="after")
     def validate_box_meta(self):
-        if len(self.groups) != len(set(self.groups)):
-            raise ValueError("Groups must be unique.")
+        _check_unique(self.groups, "Groups")
 
         for group_name in self.groups:
             self.validate_group_name(group_name)
 
-        if len(self.parents) != len(set(self.parents)):
-            raise ValueError("Parents must be unique.")
+        _check_unique(self.parents, "Parents")
 
         if self.box_id in self.parents:
             raise ValueError("A box cannot be its own parent.")
@@ -306,9 +362,13 @@ class BoxMeta(const.StrictModel):
 
         return self
 
-# %% pts/mod/_models.pct.py 11
+# %% pts/mod/_models.pct.py 14
 class BoxyardMeta(const.StrictModel):
-    box_metas: list[BoxMeta]
+    # Frozen, with `box_metas` as a tuple, so that the cached indexes below can never go
+    # stale. Build a new `BoxyardMeta` (or use `model_copy`) to change the boxes.
+    model_config = ConfigDict(frozen=True)
+
+    box_metas: tuple[BoxMeta, ...]
 
     @property
     def by_storage_location(self) -> dict[str, dict[str, BoxMeta]]:
@@ -345,16 +405,47 @@ class BoxyardMeta(const.StrictModel):
             }
         return self.__by_index_name
 
+    @cached_property
+    def _children_index(self) -> dict[str, list[BoxMeta]]:
+        """Map of box_id -> child box metas, built in a single pass."""
+        index = {box_meta.box_id: [] for box_meta in self.box_metas}
+        for box_meta in self.box_metas:
+            for parent_id in box_meta.parents:
+                index.setdefault(parent_id, []).append(box_meta)
+        return index
+
+    @cached_property
+    def _valid_parents(self) -> dict[str, tuple[str, ...]]:
+        """
+        Map of box_id -> parent ids that resolve to a box in `box_metas`. Dangling
+        parent references are dropped once here so the DAG queries don't re-check them.
+        """
+        known_ids = {box_meta.box_id for box_meta in self.box_metas}
+        return {
+            box_meta.box_id: tuple(pid for pid in box_meta.parents if pid in known_ids)
+            for box_meta in self.box_metas
+        }
+
+    @cached_property
+    def _parents_index(self) -> dict[str, list[BoxMeta]]:
+        """Map of box_id -> parent box metas. Parents that aren't known are skipped."""
+        by_id = {box_meta.box_id: box_meta for box_meta in self.box_metas}
+        return {
+            box_id: [by_id[pid] for pid in parent_ids]
+            for box_id, parent_ids in self._valid_parents.items()
+        }
+
     def children_of(self, box_id: str) -> list[BoxMeta]:
-        return [bm for bm in self.box_metas if box_id in bm.parents]
+        return list(self._children_index.get(box_id, []))
 
     def descendants_of(self, box_id: str) -> list[BoxMeta]:
+        children_index = self._children_index
         visited = set()
-        queue = [box_id]
+        queue = deque([box_id])
         result = []
         while queue:
-            current = queue.pop(0)
-            for child in self.children_of(current):
+            current = queue.popleft()
+            for child in children_index.get(current, ()):
                 if child.box_id not in visited:
                     visited.add(child.box_id)
                     result.append(child)
@@ -362,39 +453,46 @@ class BoxyardMeta(const.StrictModel):
         return result
 
     def ancestors_of(self, box_id: str) -> list[BoxMeta]:
+        parents_index = self._parents_index
         visited = set()
-        queue = [box_id]
+        queue = deque(parents_index.get(box_id, ()))
         result = []
         while queue:
-            current = queue.pop(0)
-            current_meta = self.by_id.get(current)
-            if current_meta is None:
+            parent = queue.popleft()
+            if parent.box_id in visited:
                 continue
-            for parent_id in current_meta.parents:
-                if parent_id not in visited:
-                    visited.add(parent_id)
-                    parent_meta = self.by_id.get(parent_id)
-                    if parent_meta is not None:
-                        result.append(parent_meta)
-                        queue.append(parent_id)
+            visited.add(parent.box_id)
+            result.append(parent)
+            # Every id in the index is known, so no default is needed here
+            queue.extend(parents_index[parent.box_id])
         return result
 
     def roots(self) -> list[BoxMeta]:
-        return [bm for bm in self.box_metas if len(bm.parents) == 0]
+        return [bm for bm in self.box_metas if not bm.parents]
 
     def leaves(self) -> list[BoxMeta]:
-        all_parent_ids = set()
-        for bm in self.box_metas:
-            all_parent_ids.update(bm.parents)
-        return [bm for bm in self.box_metas if bm.box_id not in all_parent_ids]
+        children_index = self._children_index
+        return [bm for bm in self.box_metas if not children_index.get(bm.box_id)]
 
     def would_create_cycle(self, child_id: str, proposed_parent_id: str) -> bool:
         if child_id == proposed_parent_id:
             return True
-        ancestors = self.ancestors_of(proposed_parent_id)
-        return any(a.box_id == child_id for a in ancestors)
+        # A cycle forms iff the proposed parent is already a descendant of the child.
+        # Walk down from the child and stop as soon as the proposed parent is reached.
+        children_index = self._children_index
+        visited = {child_id}
+        queue = deque([child_id])
+        while queue:
+            current = queue.popleft()
+            for child in children_index.get(current, ()):
+                if child.box_id == proposed_parent_id:
+                    return True
+                if child.box_id not in visited:
+                    visited.add(child.box_id)
+                    queue.append(child.box_id)
+        return False
 
-# %% pts/mod/_models.pct.py 12
+# %% pts/mod/_models.pct.py 15
 def create_boxyard_meta(config: boxyard.config.Config) -> BoxyardMeta:
     """Create a dict of all box metas. To be saved in `config.boxyard_meta_path`."""
     box_metas = []
@@ -408,7 +506,7 @@ def create_boxyard_meta(config: boxyard.config.Config) -> BoxyardMeta:
             )
     return BoxyardMeta(box_metas=box_metas)
 
-# %% pts/mod/_models.pct.py 13
+# %% pts/mod/_models.pct.py 16
 def refresh_boxyard_meta(
     config: boxyard.config.Config,
     _skip_lock: bool = False,
@@ -427,7 +525,7 @@ def refresh_boxyard_meta(
         tmp_path.rename(config.boxyard_meta_path)
     return boxyard_meta
 
-# %% pts/mod/_models.pct.py 14
+# %% pts/mod/_models.pct.py 17
 def get_boxyard_meta(
     config: boxyard.config.Config,
     force_create: bool = False,
@@ -436,7 +534,7 @@ def get_boxyard_meta(
         refresh_boxyard_meta(config)
     return BoxyardMeta.model_validate_json(config.boxyard_meta_path.read_text())
 
-# %% pts/mod/_models.pct.py 15
+# %% pts/mod/_models.pct.py 18
 def get_box_group_configs(
     config: boxyard.config.Config,
     box_metas: list[BoxMeta],
@@ -448,7 +546,7 @@ def get_box_group_configs(
                 box_group_configs[group_name] = BoxGroupConfig()
     return box_group_configs, config.virtual_box_groups
 
-# %% pts/mod/_models.pct.py 16
+# %% pts/mod/_models.pct.py 19
 def create_user_box_group_symlinks(
     config: boxyard.config.Config,
 ):
@@ -564,24 +662,69 @@ def create_user_box_group_symlinks(
     for path in config.user_box_groups_path.glob("*"):
         _remove_empty_non_group_folders(path)
 
-# %% pts/mod/_models.pct.py 18
+# %% pts/mod/_models.pct.py 21
 class SyncRecord(const.StrictModel):
+    # Sync records are written once and only ever compared or read afterwards
+    model_config = ConfigDict(frozen=True)
+
     ulid: ULID = Field(default_factory=ULID)
-    timestamp: datetime | None = (
-        None  # Is set after validation. It's just to read it easier in printouts.
-    )
     sync_complete: bool
     syncer_hostname: str
 
+    @computed_field
+    @cached_property
+    def timestamp(self) -> datetime:
+        # Derived from the ULID, and only serialized to make dumps easier to read
+        return self.ulid.datetime
+
     @classmethod
     def create(cls, sync_complete: bool, syncer_hostname: str | None = None) -> None:
         from ._utils import get_hostname
 
-        return SyncRecord(
+        return cls.create_unchecked(
+            ulid=ULID(),
             sync_complete=sync_complete,
             syncer_hostname=syncer_hostname or get_hostname(),
         )
 
+    @classmethod
+    def create_unchecked(
+        cls, ulid: ULID, sync_complete: bool, syncer_hostname: str
+    ) -> "SyncRecord":
+        """
+        Build a record from trusted, already well-typed values, skipping pydantic
+        validation. Use the regular constructor for anything read from outside.
+        """
+        return cls.model_construct(
+            ulid=ulid,
+            sync_complete=sync_complete,
+            syncer_hostname=syncer_hostname,
+        )
+
+    @classmethod
+    def create_batch(
+        cls, n: int, sync_complete: bool, syncer_hostname: str | None = None
+    ) -> list["SyncRecord"]:
+        """
+        Create `n` records at once. The ULIDs share the current timestamp and
+        increment from a single random seed, so they are unique and sort in
+        creation order without drawing fresh randomness for every record.
+        """
+        from ._utils import get_hostname
+
+        syncer_hostname = syncer_hostname or get_hostname()
+        timestamp_bytes = (time.time_ns() // 1_000_000).to_bytes(6, "big")
+        # Drop the top bit of the seed so that incrementing it can't overflow the 80-bit field
+        seed = int.from_bytes(os.urandom(10), "big") >> 1
+        return [
+            cls.create_unchecked(
+                ulid=ULID.from_bytes(timestamp_bytes + (seed + i).to_bytes(10, "big")),
+                sync_complete=sync_complete,
+                syncer_hostname=syncer_hostname,
+            )
+            for i in range(n)
+        ]
+
     async def rclone_save(
         self, rclone_config_path: str, dest: str, dest_path: str
     ) -> None:
@@ -616,16 +759,25 @@ class SyncRecord(const.StrictModel):
         else:
             return None
 
-    @model_validator(mode="after")
-    def validate_timestamp(self):
-        if self.timestamp is None:
-            self.timestamp = self.ulid.datetime
-        if self.timestamp != self.ulid.datetime:
+    @model_validator(mode="wrap")
+    @classmethod
+    def validate_timestamp(cls, data, handler):
+        # Serialized records carry `timestamp`; accept it back only if it agrees with the ULID
+        timestamp = None
+        if isinstance(data, dict) and "timestamp" in data:
+            data = dict(data)
+            timestamp = data.pop("timestamp")
+        record = handler(data)
+        if timestamp is not None and _datetime_adapter.validate_python(timestamp) != record.timestamp:
             raise ValueError("`timestamp` should be set to the ULID's datetime.")
-        return self
+        return record
 
-# %% pts/mod/_models.pct.py 19
-from typing import NamedTuple
+
+_datetime_adapter = TypeAdapter(datetime)
+
+# %% pts/mod/_models.pct.py 22
+from dataclasses import dataclass
+from typing import ClassVar
 
 
 class SyncCondition(Enum):
@@ -640,7 +792,8 @@ class SyncCondition(Enum):
     TOMBSTONED = "tombstoned"  # Box was deleted on remote
 
 
-class SyncStatus(NamedTuple):
+@dataclass(frozen=True, slots=True)
+class SyncStatus:
     sync_condition: SyncCondition
     local_path_exists: bool
     remote_path_exists: bool
@@ -649,7 +802,29 @@ class SyncStatus(NamedTuple):
     is_dir: bool
     error_message: str | None = None
 
-# %% pts/mod/_models.pct.py 20
+    # Tuple-style access, kept from when SyncStatus was a NamedTuple
+    _fields: ClassVar[tuple[str, ...]] = (
+        "sync_condition",
+        "local_path_exists",
+        "remote_path_exists",
+        "local_sync_record",
+        "remote_sync_record",
+        "is_dir",
+        "error_message",
+    )
+
+    def __iter__(self):
+        return (getattr(self, name) for name in self._fields)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(getattr(self, name) for name in self._fields[index])
+        return getattr(self, self._fields[index])
+
+    def _asdict(self) -> dict:
+        return {name: getattr(self, name) for name in self._fields}
+
+# %% pts/mod/_models.pct.py 23
 async def get_sync_status(
     rclone_config_path: str,
     local_path: str,
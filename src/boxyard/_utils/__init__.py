@@ -1,10 +1,51 @@
-def __getattr__(name):
-    import importlib
+import importlib
+import sys
+
+# Built once at import: a cold lookup imports only the submodule that defines the name
+_EXPORT_MAP = {
+    "SoftInterruption": ".base",
+    "async_throttler": ".base",
+    "check_interrupted": ".base",
+    "check_last_time_modified": ".base",
+    "count_files_in_dir": ".base",
+    "enable_soft_interruption": ".base",
+    "get_box_index_name_from_sub_path": ".base",
+    "get_hostname": ".base",
+    "is_in_event_loop": ".base",
+    "run_cmd_async": ".base",
+    "run_fzf": ".base",
+    "BOX_SYNC_LOCK_TIMEOUT": ".locking",
+    "BoxyardLockManager": ".locking",
+    "GLOBAL_LOCK_TIMEOUT": ".locking",
+    "LOCK_POLL_INTERVAL": ".locking",
+    "LockAcquisitionError": ".locking",
+    "acquire_lock_async": ".locking",
+    "async_box_sync_lock": ".locking",
+    "async_global_lock": ".locking",
+    "auto_cleanup_stale_locks": ".locking",
+    "cleanup_stale_locks": ".locking",
+    "BisyncResult": ".rclone",
+    "rclone_bisync": ".rclone",
+    "rclone_cat": ".rclone",
+    "rclone_copy": ".rclone",
+    "rclone_copyto": ".rclone",
+    "rclone_delete": ".rclone",
+    "rclone_lsjson": ".rclone",
+    "rclone_mkdir": ".rclone",
+    "rclone_move": ".rclone",
+    "rclone_moveto": ".rclone",
+    "rclone_path_exists": ".rclone",
+    "rclone_purge": ".rclone",
+    "rclone_sync": ".rclone",
+    "rclone_write": ".rclone",
+}
 
-    _modules = [".base", ".locking", ".rclone"]
-    for mod_path in _modules:
-        mod = importlib.import_module(mod_path, __name__)
-        if hasattr(mod, name):
-            globals()[name] = getattr(mod, name)
-            return globals()[name]
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __getattr__(name):
+    mod_path = _EXPORT_MAP.get(name)
+    if mod_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(importlib.import_module(mod_path, __name__), name)
+    # Later lookups find the attribute on the module and skip __getattr__
+    setattr(sys.modules[__name__], name, attr)
+    return attr
@@ -38,10 +38,13 @@ def get_box_index_name_from_sub_path(
     return box_index_name
 
 # %% pts/mod/_utils/00_base.pct.py 7
+import functools
 import platform
 
 
+@functools.lru_cache(maxsize=1)
 def get_hostname():
+    # The hostname is stable for the life of the process, and on macOS looking it up spawns `scutil`
     system = platform.system()
     hostname = None
     if system == "Darwin":
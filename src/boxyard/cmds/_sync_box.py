@@ -4,7 +4,14 @@ from pathlib import Path
 import asyncio
 
 from .._utils.sync_helper import sync_helper, SyncSetting, SyncDirection
-from .._models import SyncStatus, BoxPart, BoxMeta, SyncCondition
+from .._models import (
+    SyncStatus,
+    BoxPart,
+    BoxMeta,
+    SyncCondition,
+    get_remote_box_part_path,
+    get_remote_box_sync_record_path,
+)
 from ..config import get_config, StorageType
 from .._utils import (
     check_interrupted,
@@ -88,33 +95,6 @@ async def sync_box(
     # If remote exists with different name, use that name for remote paths
     if remote_index_name is None:
         remote_index_name = box_index_name
-    
-    # Precompute remote paths using the remote_index_name (which may differ from local)
-    def _get_remote_path_for_index(idx_name: str) -> Path:
-        return (
-            config.storage_locations[storage_location].store_path
-            / const.REMOTE_BOXES_REL_PATH
-            / idx_name
-        )
-    
-    def _get_remote_part_path_for_index(idx_name: str, part: BoxPart) -> Path:
-        base = _get_remote_path_for_index(idx_name)
-        if part == BoxPart.DATA:
-            return base / const.BOX_DATA_REL_PATH
-        elif part == BoxPart.META:
-            return base / const.BOX_METAFILE_REL_PATH
-        elif part == BoxPart.CONF:
-            return base / const.BOX_CONF_REL_PATH
-        raise ValueError(f"Invalid box part: {part}")
-    
-    def _get_remote_sync_record_path_for_index(idx_name: str, part: BoxPart) -> Path:
-        sl_conf = config.storage_locations[storage_location]
-        return (
-            sl_conf.store_path
-            / const.SYNC_RECORDS_REL_PATH
-            / idx_name
-            / f"{part.value}.rec"
-        )
     _sync_lock = None
     if not _skip_lock:
         _lock_manager = BoxyardLockManager(config.boxyard_data_path)
@@ -155,9 +135,11 @@ async def sync_box(
                 local_path=box_meta.get_local_part_path(config, BoxPart.META),
                 local_sync_record_path=box_meta.get_local_sync_record_path(config, sync_part),
                 remote=box_meta.storage_location,
-                remote_path=_get_remote_part_path_for_index(remote_index_name, BoxPart.META),
-                remote_sync_record_path=_get_remote_sync_record_path_for_index(
-                    remote_index_name, sync_part
+                remote_path=get_remote_box_part_path(
+                    config, storage_location, remote_index_name, BoxPart.META
+                ),
+                remote_sync_record_path=get_remote_box_sync_record_path(
+                    config, storage_location, remote_index_name, sync_part
                 ),
                 local_sync_backups_path=local_sync_backups_path,
                 remote_sync_backups_path=remote_sync_backups_path,
@@ -180,9 +162,11 @@ async def sync_box(
                 local_path=box_meta.get_local_part_path(config, BoxPart.CONF),
                 local_sync_record_path=box_meta.get_local_sync_record_path(config, sync_part),
                 remote=box_meta.storage_location,
-                remote_path=_get_remote_part_path_for_index(remote_index_name, BoxPart.CONF),
-                remote_sync_record_path=_get_remote_sync_record_path_for_index(
-                    remote_index_name, sync_part
+                remote_path=get_remote_box_part_path(
+                    config, storage_location, remote_index_name, BoxPart.CONF
+                ),
+                remote_sync_record_path=get_remote_box_sync_record_path(
+                    config, storage_location, remote_index_name, sync_part
                 ),
                 local_sync_backups_path=local_sync_backups_path,
                 remote_sync_backups_path=remote_sync_backups_path,
@@ -225,9 +209,11 @@ async def sync_box(
                 local_path=box_meta.get_local_part_path(config, BoxPart.DATA),
                 local_sync_record_path=box_meta.get_local_sync_record_path(config, sync_part),
                 remote=box_meta.storage_location,
-                remote_path=_get_remote_part_path_for_index(remote_index_name, BoxPart.DATA),
-                remote_sync_record_path=_get_remote_sync_record_path_for_index(
-                    remote_index_name, sync_part
+                remote_path=get_remote_box_part_path(
+                    config, storage_location, remote_index_name, BoxPart.DATA
+                ),
+                remote_sync_record_path=get_remote_box_sync_record_path(
+                    config, storage_location, remote_index_name, sync_part
                 ),
                 local_sync_backups_path=local_sync_backups_path,
                 remote_sync_backups_path=remote_sync_backups_path,
@@ -4,6 +4,7 @@ __all__ = ['BOX_CONF_REL_PATH', 'BOX_DATA_REL_PATH', 'BOX_METAFILE_REL_PATH', 'B
 
 # %% pts/mod/const.pct.py 3
 from pathlib import Path
+import functools
 import textwrap
 import string
 from pydantic import BaseModel, ConfigDict
@@ -53,5 +54,23 @@ ENV_VAR_BOXYARD_CONFIG_PATH = "BOXYARD_CONFIG_PATH"
 ENV_VAR_DEFAULT_BOX_GROUPS = "DEFAULT_BOX_GROUPS"
 
 # %% pts/mod/const.pct.py 13
+@functools.cache
+def _cached_property_names(cls: type) -> tuple[str, ...]:
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name, attr in vars(klass).items()
+        if isinstance(attr, functools.cached_property)
+    )
+
+
 class StrictModel(BaseModel):
     model_config = ConfigDict(extra="forbid")
+
+    def model_copy(self, *, update=None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        # `cached_property` values live in the instance __dict__, which model_copy copies
+        # along with the fields; drop them so the copy derives them from its own fields
+        for name in _cached_property_names(type(self)):
+            copied.__dict__.pop(name, None)
+        return copied
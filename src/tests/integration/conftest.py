@@ -3,12 +3,11 @@
 __all__ = ['CmdFailed', 'FIXTURE_CONFIGS_PATH', 'create_boxyards', 'run_cmd', 'run_cmd_in_background', 'temp_boxyard', 'test_boxyard_local', 'test_boxyard_remote']
 
 # %% pts/tests/integration/conftest.pct.py 2
+import shlex
 import subprocess
 from pathlib import Path
-import tempfile
 import shutil
 import toml
-import inspect
 import pytest
 
 from boxyard.cmds import init_boxyard
@@ -227,12 +226,7 @@ def temp_boxyard(tmp_path):
     # Set up a rclone remote path (alias to local folder)
     config.rclone_config_path.write_text(
         config.rclone_config_path.read_text()
-        + "\n"
-        + inspect.cleandoc(f"""
-    [{remote_name}]
-    type = alias
-    remote = {remote_rclone_path}
-    """)
+        + f"\n[{remote_name}]\ntype = alias\nremote = {remote_rclone_path}\n"
     )
 
     config_path.write_text(toml.dumps(config_dump))
@@ -253,24 +247,32 @@ def create_boxyards(remote_name="my_remote", num_boxyards=1):
         remote_name: Name for the rclone remote
         num_boxyards: Number of boxyards to create (for multi-machine tests)
 
+    The remote and all boxyards are created under a single /tmp/boxyard_batch_*
+    directory (remote_rclone_path.parent).
+
     Returns:
         If num_boxyards == 1:
             tuple: (remote_name, remote_rclone_path, config, config_path, data_path)
         If num_boxyards > 1:
             tuple: (remote_name, remote_rclone_path, list of (config, config_path, data_path))
     """
-    remote_rclone_path = Path(tempfile.mkdtemp(prefix=f"{remote_name}_", dir="/tmp"))
+    # Only the legacy tests call this, so don't load it at collection time
+    import tempfile
+
+    # Everything lives under one parent, so a single rmtree of it cleans up the whole batch
+    batch_path = Path(tempfile.mkdtemp(prefix="boxyard_batch_", dir="/tmp"))
+    remote_rclone_path = batch_path / remote_name
+    remote_rclone_path.mkdir()
 
     boxyards = []
     for i in range(num_boxyards):
-        test_folder_path = Path(tempfile.mkdtemp(prefix=f"boxyard_{i}_", dir="/tmp"))
-        test_folder_path.mkdir(parents=True, exist_ok=True)
+        test_folder_path = batch_path / f"boxyard_{i}"
+        test_folder_path.mkdir()
         config_path = test_folder_path / ".config" / "boxyard" / "config.toml"
         data_path = test_folder_path / ".boxyard"
 
         # Run init
         init_boxyard(config_path=config_path, data_path=data_path, verbose=False)
-        config = get_config(config_path)
 
         # Add a storage location
         config_dump = toml.load(config_path)
@@ -283,22 +285,15 @@ def create_boxyards(remote_name="my_remote", num_boxyards=1):
             "store_path": "boxyard",
         }
 
-        # Set up a rclone remote path
-        config.rclone_config_path.write_text(
-            config.rclone_config_path.read_text()
-            + "\n"
-            + inspect.cleandoc(f"""
-        [{remote_name}]
-        type = alias
-        remote = {remote_rclone_path}
-        """)
-        )
-
         config_path.write_text(toml.dumps(config_dump))
 
-        # Load config
+        # Load config once, after all edits
         config = get_config(config_path)
 
+        # Set up a rclone remote path (appended to the rclone config init_boxyard wrote)
+        with open(config.rclone_config_path, "a") as f:
+            f.write(f"\n[{remote_name}]\ntype = alias\nremote = {remote_rclone_path}\n")
+
         boxyards.append((config, config_path, data_path))
 
     if len(boxyards) == 1:
@@ -318,23 +313,26 @@ class CmdFailed(Exception):
     pass
 
 
-def run_cmd(cmd: str, capture_output: bool = True):
-    """Run a shell command and return its output.
+def run_cmd(cmd: str, capture_output: bool = True, shell: bool = False):
+    """Run a command and return its output.
 
     Args:
-        cmd: Shell command to run
+        cmd: Command to run, split with shlex unless shell is True
         capture_output: Whether to capture and return stdout
+        shell: Run the command through the shell (for pipes, redirects, etc.)
 
     Returns:
         stdout if capture_output is True
 
     Raises:
-        CmdFailed: If the command exits with non-zero status
+        CmdFailed: If the command exits with non-zero status or cannot be found
     """
-    if not capture_output:
-        res = subprocess.run(cmd, shell=True)
-    else:
-        res = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+    args = cmd if shell else shlex.split(cmd)
+    try:
+        res = subprocess.run(args, shell=shell, capture_output=capture_output, text=True)
+    except FileNotFoundError as e:
+        # Without a shell there is no "command not found" exit status to report
+        raise CmdFailed(f"Command '{cmd}' failed: {e}") from e
     if res.returncode != 0:
         raise CmdFailed(
             f"Command '{cmd}' failed with return code {res.returncode}. "
@@ -344,19 +342,21 @@ def run_cmd(cmd: str, capture_output: bool = True):
         return res.stdout
 
 
-def run_cmd_in_background(cmd: str, print_output: bool = False):
-    """Run a shell command in the background.
+def run_cmd_in_background(cmd: str, print_output: bool = False, shell: bool = False):
+    """Run a command in the background.
 
     Args:
-        cmd: Shell command to run
+        cmd: Command to run, split with shlex unless shell is True
         print_output: Whether to show output
+        shell: Run the command through the shell (for pipes, redirects, etc.)
 
     Returns:
         subprocess.Popen instance
     """
+    args = cmd if shell else shlex.split(cmd)
     if print_output:
-        return subprocess.Popen(cmd, shell=True)
+        return subprocess.Popen(args, shell=shell)
     else:
         return subprocess.Popen(
-            cmd, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            args, shell=shell, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
         )
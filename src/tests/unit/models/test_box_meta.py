@@ -4,14 +4,24 @@ __all__ = ['TestBoxId', 'TestBoxMetaCreate', 'TestBoxMetaValidation', 'TestBoxPa
 
 # %% pts/tests/unit/models/test_box_meta.pct.py 2
 import pytest
+import re
 from datetime import datetime, timezone
-from pathlib import Path
+from pathlib import Path, PurePosixPath, PureWindowsPath
 from unittest.mock import MagicMock, patch
 from pydantic import ValidationError
 
-from boxyard._models import BoxMeta, BoxPart
+from boxyard._models import (
+    BoxMeta,
+    BoxPart,
+    get_remote_box_part_path,
+    get_remote_box_sync_record_path,
+)
 from boxyard import const
 
+_MATCH_INVALID_GROUP = re.compile("Invalid group name")
+_MATCH_UNIQUE_GROUPS = re.compile("Groups must be unique")
+_MATCH_INVALID_TIMESTAMP = re.compile("Creation timestamp is not valid")
+
 
 # ============================================================================
 # Tests for box_id property
@@ -110,6 +120,38 @@ class TestIndexName:
         )
         assert box_meta.index_name == "20251122_143022_a7kx9__my-test_project"
 
+    def test_model_copy_recomputes_cached_properties(self):
+        """A copy with updated fields doesn't keep the original's cached values."""
+        box_meta = BoxMeta(
+            creation_timestamp_utc="20251122_143022",
+            box_subid="a7kx9",
+            name="foo",
+            storage_location="default",
+            creator_hostname="myhost",
+            groups=[],
+        )
+        assert box_meta.index_name == "20251122_143022_a7kx9__foo"
+        assert box_meta.creation_timestamp_datetime == datetime(2025, 11, 22, 14, 30, 22)
+
+        copied = box_meta.model_copy(update={"name": "bar", "creation_timestamp_utc": "20251123"})
+
+        assert copied.index_name == "20251123_a7kx9__bar"
+        assert copied.creation_timestamp_datetime == datetime(2025, 11, 23)
+        assert box_meta.index_name == "20251122_143022_a7kx9__foo"
+
+    def test_index_name_is_cached(self):
+        """index_name is computed once per instance and not included in dumps."""
+        box_meta = BoxMeta(
+            creation_timestamp_utc="20251122_143022",
+            box_subid="a7kx9",
+            name="myproject",
+            storage_location="default",
+            creator_hostname="myhost",
+            groups=[],
+        )
+        assert box_meta.index_name is box_meta.index_name
+        assert "index_name" not in box_meta.model_dump()
+
 
 # ============================================================================
 # Tests for creation_timestamp_datetime property
@@ -165,53 +207,53 @@ class TestCreationTimestampDatetime:
 class TestValidateGroupName:
     """Tests for the validate_group_name class method."""
 
-    def test_valid_alphanumeric(self):
-        """Valid alphanumeric group names."""
-        BoxMeta.validate_group_name("group1")
-        BoxMeta.validate_group_name("GROUP1")
-        BoxMeta.validate_group_name("Group123")
-
-    def test_valid_with_underscore(self):
-        """Valid group names with underscores."""
-        BoxMeta.validate_group_name("my_group")
-        BoxMeta.validate_group_name("test_group_123")
-        BoxMeta.validate_group_name("_underscore")
-
-    def test_valid_with_hyphen(self):
-        """Valid group names with hyphens."""
-        BoxMeta.validate_group_name("my-group")
-        BoxMeta.validate_group_name("test-group-123")
-        BoxMeta.validate_group_name("-hyphen")
-
-    def test_valid_with_slash(self):
-        """Valid group names with slashes (for hierarchical groups)."""
-        BoxMeta.validate_group_name("parent/child")
-        BoxMeta.validate_group_name("a/b/c")
-        BoxMeta.validate_group_name("projects/backend/api")
-
-    def test_invalid_with_space(self):
-        """Group names with spaces are invalid."""
-        with pytest.raises(ValueError, match="Invalid group name"):
-            BoxMeta.validate_group_name("my group")
-
-    def test_invalid_with_special_chars(self):
-        """Group names with special characters are invalid."""
-        invalid_names = ["group@test", "group#1", "group$", "group%", "group&"]
-        for name in invalid_names:
-            with pytest.raises(ValueError, match="Invalid group name"):
-                BoxMeta.validate_group_name(name)
-
-    def test_invalid_empty_string(self):
-        """Empty string is invalid."""
-        with pytest.raises(ValueError, match="Invalid group name"):
-            BoxMeta.validate_group_name("")
-
-    def test_invalid_non_string(self):
-        """Non-string values are invalid."""
-        with pytest.raises(ValueError, match="Invalid group name"):
-            BoxMeta.validate_group_name(123)
-        with pytest.raises(ValueError, match="Invalid group name"):
-            BoxMeta.validate_group_name(None)
+    @pytest.mark.parametrize(
+        "name",
+        [
+            # Alphanumeric
+            "group1",
+            "GROUP1",
+            "Group123",
+            # Underscores
+            "my_group",
+            "test_group_123",
+            "_underscore",
+            # Hyphens
+            "my-group",
+            "test-group-123",
+            "-hyphen",
+            # Slashes (for hierarchical groups)
+            "parent/child",
+            "a/b/c",
+            "projects/backend/api",
+        ],
+    )
+    def test_valid(self, name):
+        """Valid group names are accepted."""
+        BoxMeta.validate_group_name(name)
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            # Spaces
+            "my group",
+            # Special characters
+            "group@test",
+            "group#1",
+            "group$",
+            "group%",
+            "group&",
+            # Empty string
+            "",
+            # Non-string values
+            123,
+            None,
+        ],
+    )
+    def test_invalid(self, name):
+        """Invalid group names are rejected."""
+        with pytest.raises(ValueError, match=_MATCH_INVALID_GROUP):
+            BoxMeta.validate_group_name(name)
 
 
 # ============================================================================
@@ -224,7 +266,7 @@ class TestBoxMetaValidation:
 
     def test_duplicate_groups_rejected(self):
         """Duplicate groups in the list are rejected."""
-        with pytest.raises(ValidationError, match="Groups must be unique"):
+        with pytest.raises(ValidationError, match=_MATCH_UNIQUE_GROUPS):
             BoxMeta(
                 creation_timestamp_utc="20251122_143022",
                 box_subid="a7kx9",
@@ -236,7 +278,7 @@ class TestBoxMetaValidation:
 
     def test_invalid_group_name_in_list_rejected(self):
         """Invalid group names in the list are rejected."""
-        with pytest.raises(ValidationError, match="Invalid group name"):
+        with pytest.raises(ValidationError, match=_MATCH_INVALID_GROUP):
             BoxMeta(
                 creation_timestamp_utc="20251122_143022",
                 box_subid="a7kx9",
@@ -248,7 +290,7 @@ class TestBoxMetaValidation:
 
     def test_invalid_timestamp_format_rejected(self):
         """Invalid timestamp formats are rejected."""
-        with pytest.raises(ValidationError, match="Creation timestamp is not valid"):
+        with pytest.raises(ValidationError, match=_MATCH_INVALID_TIMESTAMP):
             BoxMeta(
                 creation_timestamp_utc="2025-11-22",  # Wrong format
                 box_subid="a7kx9",
@@ -258,9 +300,21 @@ class TestBoxMetaValidation:
                 groups=[],
             )
 
+    def test_truncated_timestamp_rejected(self):
+        """Timestamps with a truncated time part are rejected."""
+        with pytest.raises(ValidationError, match=_MATCH_INVALID_TIMESTAMP):
+            BoxMeta(
+                creation_timestamp_utc="20251122_1430",  # Missing seconds
+                box_subid="a7kx9",
+                name="myproject",
+                storage_location="default",
+                creator_hostname="myhost",
+                groups=[],
+            )
+
     def test_invalid_timestamp_value_rejected(self):
         """Invalid timestamp values are rejected."""
-        with pytest.raises(ValidationError, match="Creation timestamp is not valid"):
+        with pytest.raises(ValidationError, match=_MATCH_INVALID_TIMESTAMP):
             BoxMeta(
                 creation_timestamp_utc="20251399_143022",  # Invalid month
                 box_subid="a7kx9",
@@ -283,6 +337,20 @@ class TestBoxMetaValidation:
         assert box_meta.name == "myproject"
         assert box_meta.groups == ["group1", "group2"]
 
+    def test_box_meta_is_frozen(self):
+        """Fields cannot be reassigned after construction."""
+        box_meta = BoxMeta(
+            creation_timestamp_utc="20251122_143022",
+            box_subid="a7kx9",
+            name="myproject",
+            storage_location="default",
+            creator_hostname="myhost",
+            groups=[],
+        )
+        with pytest.raises(ValidationError):
+            box_meta.name = "renamed"
+        assert box_meta.index_name == "20251122_143022_a7kx9__myproject"
+
     def test_empty_groups_allowed(self):
         """Empty groups list is allowed."""
         box_meta = BoxMeta(
@@ -425,8 +493,9 @@ class TestPathGeneration:
     def test_get_remote_path(self, mock_config, box_meta):
         """get_remote_path returns correct path."""
         remote_path = box_meta.get_remote_path(mock_config)
-        expected = Path("remote:bucket/boxyard/boxes/20251122_143022_a7kx9__myproject")
+        expected = PurePosixPath("remote:bucket/boxyard/boxes/20251122_143022_a7kx9__myproject")
         assert remote_path == expected
+        assert type(remote_path) is PurePosixPath
 
     def test_get_local_part_path_data(self, mock_config, box_meta):
         """get_local_part_path returns correct path for DATA."""
@@ -449,19 +518,19 @@ class TestPathGeneration:
     def test_get_remote_part_path_data(self, mock_config, box_meta):
         """get_remote_part_path returns correct path for DATA."""
         data_path = box_meta.get_remote_part_path(mock_config, BoxPart.DATA)
-        expected = Path("remote:bucket/boxyard/boxes/20251122_143022_a7kx9__myproject/data")
+        expected = PurePosixPath("remote:bucket/boxyard/boxes/20251122_143022_a7kx9__myproject/data")
         assert data_path == expected
 
     def test_get_remote_part_path_meta(self, mock_config, box_meta):
         """get_remote_part_path returns correct path for META."""
         meta_path = box_meta.get_remote_part_path(mock_config, BoxPart.META)
-        expected = Path("remote:bucket/boxyard/boxes/20251122_143022_a7kx9__myproject/boxmeta.toml")
+        expected = PurePosixPath("remote:bucket/boxyard/boxes/20251122_143022_a7kx9__myproject/boxmeta.toml")
         assert meta_path == expected
 
     def test_get_remote_part_path_conf(self, mock_config, box_meta):
         """get_remote_part_path returns correct path for CONF."""
         conf_path = box_meta.get_remote_part_path(mock_config, BoxPart.CONF)
-        expected = Path("remote:bucket/boxyard/boxes/20251122_143022_a7kx9__myproject/conf")
+        expected = PurePosixPath("remote:bucket/boxyard/boxes/20251122_143022_a7kx9__myproject/conf")
         assert conf_path == expected
 
     def test_get_local_sync_record_path(self, mock_config, box_meta):
@@ -475,14 +544,41 @@ class TestPathGeneration:
         """get_remote_sync_record_path returns correct path."""
         for part in BoxPart:
             sync_path = box_meta.get_remote_sync_record_path(mock_config, part)
-            expected = Path(f"remote:bucket/boxyard/sync_records/20251122_143022_a7kx9__myproject/{part.value}.rec")
+            expected = PurePosixPath(f"remote:bucket/boxyard/sync_records/20251122_143022_a7kx9__myproject/{part.value}.rec")
             assert sync_path == expected
 
+    def test_remote_paths_are_posix_for_windows_store_path(self, mock_config, box_meta):
+        """Remote paths use forward slashes even if store_path is a Windows path."""
+        mock_config.storage_locations["default"].store_path = PureWindowsPath(r"C:\store\boxyard")
+        assert str(box_meta.get_remote_path(mock_config)) == (
+            "C:/store/boxyard/boxes/20251122_143022_a7kx9__myproject"
+        )
+        assert str(box_meta.get_remote_sync_record_path(mock_config, BoxPart.DATA)) == (
+            "C:/store/boxyard/sync_records/20251122_143022_a7kx9__myproject/data.rec"
+        )
+
+    def test_remote_path_helpers_take_index_name(self, mock_config, box_meta):
+        """The module-level helpers build the same paths for an arbitrary index name."""
+        for part in BoxPart:
+            assert get_remote_box_part_path(
+                mock_config, "default", box_meta.index_name, part
+            ) == box_meta.get_remote_part_path(mock_config, part)
+            assert get_remote_box_sync_record_path(
+                mock_config, "default", box_meta.index_name, part
+            ) == box_meta.get_remote_sync_record_path(mock_config, part)
+        renamed = get_remote_box_part_path(
+            mock_config, "default", "20251122_143022_a7kx9__renamed", BoxPart.META
+        )
+        assert renamed == PurePosixPath(
+            "remote:bucket/boxyard/boxes/20251122_143022_a7kx9__renamed/boxmeta.toml"
+        )
+
     def test_invalid_box_part_raises_error(self, mock_config, box_meta):
         """Invalid box part raises ValueError."""
-        # This test documents expected behavior - we can't easily test with
-        # an invalid enum value, but we verify the paths are correct for all valid parts
-        pass
+        with pytest.raises(ValueError, match="Invalid box part"):
+            box_meta.get_local_part_path(mock_config, "not_a_part")
+        with pytest.raises(ValueError, match="Invalid box part"):
+            box_meta.get_remote_part_path(mock_config, "not_a_part")
 
 
 # ============================================================================
@@ -66,7 +66,7 @@ class TestBoxyardMetaConstruction:
     def test_construction_with_empty_list(self):
         """BoxyardMeta can be created with an empty list."""
         meta = BoxyardMeta(box_metas=[])
-        assert meta.box_metas == []
+        assert meta.box_metas == ()
 
     def test_construction_with_box_metas(self, sample_box_metas):
         """BoxyardMeta stores box_metas correctly."""
@@ -75,6 +75,21 @@ class TestBoxyardMetaConstruction:
         assert meta.box_metas[0].name == "project-alpha"
         assert meta.box_metas[3].name == "project-delta"
 
+    def test_box_metas_cannot_change_after_queries(self, sample_box_metas):
+        """box_metas is frozen, so the cached DAG indexes can't go stale."""
+        from pydantic import ValidationError
+
+        meta = BoxyardMeta(box_metas=sample_box_metas[:1])
+        assert meta.leaves() == sample_box_metas[:1]
+
+        with pytest.raises(AttributeError):
+            meta.box_metas.append(sample_box_metas[1])
+        with pytest.raises(ValidationError):
+            meta.box_metas = sample_box_metas
+
+        grown = BoxyardMeta(box_metas=[*meta.box_metas, sample_box_metas[1]])
+        assert grown.leaves() == sample_box_metas[:2]
+
 
 # ============================================================================
 # Tests for by_storage_location property